@@ -2,20 +2,25 @@
 
 from __future__ import annotations
 
-import base64
-import hashlib
-import mimetypes
+import io
+import os
 import re
-import unicodedata
+import threading
 import warnings
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Iterable, Iterator, Mapping
 from contextlib import suppress
 from dataclasses import dataclass, field
 from datetime import date
+from functools import lru_cache
+from itertools import chain, repeat
+from operator import itemgetter
 from pathlib import Path
+from types import MappingProxyType
 from typing import (
     TYPE_CHECKING,
     Any,
+    BinaryIO,
+    Literal,
     Protocol,
     Union,
     runtime_checkable,
@@ -72,6 +77,11 @@ def strikethrough(text: str) -> str:
 
 
 CODE_FENCE_MIN = 3
+_SLUG_RE = re.compile(r"[^a-zA-Z0-9]+")
+_BACKTICK_RUN = re.compile(r"`+")
+_CHECKLIST_PREFIX = ("- [ ] ", "- [x] ")  # indexed by the item's done flag
+_SRC_RE = re.compile(r'src="([^"]+)"')
+_HEADER_PREFIXES = tuple("#" * i + " " for i in range(7))  # indexed by heading level
 
 
 # =========================================================
@@ -89,24 +99,171 @@ class MarkdownRenderable(Protocol):
 
 def _md_escape_cell(x: Any) -> str:
     """Escape Markdown table cell content (pipes/newlines)."""
-    s = str(x)
-    s = s.replace("|", r"\|")
-    s = s.replace("\n", "<br>")
-    return s
+    # str.replace is memchr-backed and returns the same object when nothing matches;
+    # a multi-char str.translate table measured ~10x slower on typical cells.
+    return str(x).replace("|", r"\|").replace("\n", "<br>")
+
+
+# Control-character sentinels used to escape a whole table body in bulk
+_CELL_SEP = "\x00"
+_ROW_SEP = "\x01"
+
+
+def _md_table_body(rows: list[list[Any]]) -> str:
+    """Render table body rows, escaping all cell text in a handful of C-level passes."""
+    blob = _ROW_SEP.join([_CELL_SEP.join(map(str, r)) for r in rows])
+    cell_seps = sum(len(r) - 1 for r in rows if r)
+    if blob.count(_CELL_SEP) != cell_seps or blob.count(_ROW_SEP) != len(rows) - 1:
+        # A cell contains a sentinel character; escape cell by cell instead
+        return "".join(f"| {' | '.join(map(_md_escape_cell, r))} |\n" for r in rows)
+    blob = blob.replace("|", r"\|").replace("\n", "<br>")
+    blob = blob.replace(_CELL_SEP, " | ").replace(_ROW_SEP, " |\n| ")
+    return f"| {blob} |\n"
+
+
+# ASCII table: letters lowercased, anything non-alphanumeric becomes "-"
+_SLUG_TABLE = {c: "-" for c in range(128) if not chr(c).isalnum()}
+_SLUG_TABLE.update({c: chr(c).lower() for c in range(ord("A"), ord("Z") + 1)})
+_DASH_RUN = re.compile(r"-+")
+
+
+@lru_cache(maxsize=1024)
+def _short_hash(*parts: str) -> str:
+    """Return a 10-char hex token for ``parts``; stable across reruns and processes."""
+    import hashlib
+
+    # 5-byte digest hexes to exactly 10 chars; no oversized md5 hex to slice
+    return hashlib.blake2b("||".join(parts).encode(), digest_size=5).hexdigest()
+
+
+def _stable_key(*parts: str) -> str:
+    """Derive a Streamlit widget/session key that is stable across reruns and reports."""
+    return f"k_{_short_hash(*parts)}"
+
+
+# Image sources the browser can load as-is (no stat/read/encode)
+_INLINE_OR_REMOTE_SRC = ("data:", "http://", "https://", "//")
+
+# Fixed Dash component ids (same values the per-build hashing used to produce)
+_DASH_PDF_BUTTON_ID = f"mf_{_short_hash('pdf', 'button')}"
+_DASH_PDF_DOWNLOAD_ID = f"mf_{_short_hash('pdf', 'download')}"
+
+
+@lru_cache(maxsize=1024)
+def _norm_nfkd(s: str) -> str:
+    """NFKD-normalize a (typically repeated) title string."""
+    import unicodedata
+
+    return unicodedata.normalize("NFKD", s)
+
+
+# Common image formats, resolved without consulting the mimetypes registry
+_IMAGE_MIME = {
+    ".png": "image/png",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".gif": "image/gif",
+    ".svg": "image/svg+xml",
+    ".webp": "image/webp",
+    ".bmp": "image/bmp",
+}
+
+
+@lru_cache(maxsize=256)
+def _data_uri(path: str, mtime_ns: int, size: int) -> str:
+    """Base64 data URI for an image file; (mtime, size) in the key invalidate on change."""
+    try:
+        # SIMD (SSSE3/AVX2/NEON) encoder when installed; same output as the stdlib
+        from pybase64 import b64encode  # type: ignore
+    except ImportError:
+        from base64 import b64encode
+
+    p = Path(path)
+    data = b64encode(p.read_bytes()).decode("ascii")
+    mime = _IMAGE_MIME.get(p.suffix.lower())
+    if mime is None:
+        import mimetypes
+
+        mime = mimetypes.guess_type(p.name)[0] or "image/png"
+    return f"data:{mime};base64,{data}"
 
 
 def _slug(s: str) -> str:
-    s = unicodedata.normalize("NFKD", s).encode("ascii", "ignore").decode("ascii")
-    s = re.sub(r"[^a-zA-Z0-9]+", "-", s).strip("-").lower()
+    if s.isascii():
+        # Fast path: NFKD is a no-op for ASCII titles, so skip normalization
+        s = _DASH_RUN.sub("-", s.translate(_SLUG_TABLE))
+    else:
+        s = _norm_nfkd(s).encode("ascii", "ignore").decode("ascii")
+        s = _SLUG_RE.sub("-", s).lower()
+    s = s.strip("-")
     return s or "section"
 
 
+# Linux ioctl request number for copy-on-write clones (``FICLONE`` in linux/fs.h)
+_FICLONE = 0x40049409
+
+AssetCopyMode = Literal["copy", "link", "reflink", "auto"]
+
+
+def _reflink(src: Path, dst: Path) -> None:
+    """Clone ``src`` into ``dst`` sharing extents (btrfs/XFS); raises OSError if unsupported."""
+    import fcntl
+    import shutil
+
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        try:
+            fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+        except OSError:
+            # Don't leave the empty file opened above behind as the "asset"
+            fdst.close()
+            dst.unlink(missing_ok=True)
+            raise
+    shutil.copystat(src, dst)
+
+
+_COPY_BUFSIZE = 4 * 1024 * 1024
+
+
+def _copy_file(src: Path, dst: Path) -> None:
+    """Copy bytes + metadata like ``shutil.copy2`` using sendfile or large buffers."""
+    import shutil
+
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        sent = 0
+        if hasattr(os, "sendfile"):
+            try:
+                size = os.fstat(fsrc.fileno()).st_size
+                while sent < size:
+                    n = os.sendfile(fdst.fileno(), fsrc.fileno(), sent, size - sent)
+                    if n == 0:
+                        break
+                    sent += n
+            except OSError:
+                # e.g. platforms where sendfile cannot target regular files
+                sent = 0
+                fdst.seek(0)
+                fdst.truncate()
+        if not sent:
+            fsrc.seek(0)
+            shutil.copyfileobj(fsrc, fdst, length=_COPY_BUFSIZE)
+    shutil.copystat(src, dst)
+
+
 # Simple asset manager for relocating images for HTML/PDF renders
-@dataclass
+@dataclass(slots=True)
 class AssetManager:
-    """Simple helper to relocate assets (images, figures) for renders."""
+    """Simple helper to relocate assets (images, figures) for renders.
+
+    ``mode`` picks how bytes land in ``base``: ``"copy"`` (the default) always
+    copies, ``"reflink"`` clones copy-on-write, ``"link"`` hardlinks, and ``"auto"``
+    tries link, then reflink, then falls back to a regular copy. Hardlinked assets
+    share storage with their source, so writing to either file changes both.
+    ``"copy"`` and ``"auto"`` are best-effort; ``"link"`` and ``"reflink"`` raise
+    when the filesystem cannot honour them.
+    """
 
     base: Path = Path(".easypour_assets")
+    mode: AssetCopyMode = "copy"
 
     def __post_init__(self) -> None:
         """Ensure the asset directory exists."""
@@ -117,22 +274,59 @@ class AssetManager:
         src_p = Path(src)
         dst = self.base / (name or src_p.name)
         try:
-            if src_p.resolve() != dst.resolve():
-                import shutil
-
-                shutil.copy2(src_p, dst)
+            src_st = os.stat(src_p)
+            try:
+                dst_st = os.stat(dst)
+            except FileNotFoundError:
+                dst_st = None
+            if dst_st is not None:
+                if os.path.samestat(src_st, dst_st):
+                    return dst
+                dst.unlink()
+            self._ingest(src_p, dst)
         except Exception:
-            # Best-effort; ignore copy failures
-            pass
+            # Best-effort for copy/auto; an explicitly requested link/reflink must not
+            # fail silently
+            if self.mode in ("link", "reflink"):
+                raise
         return dst
 
+    def put_many(self, sources: Iterable[Path | str]) -> dict[str, Path]:
+        """Relocate several assets, ingesting each distinct source once.
+
+        Returns a mapping of ``str(source)`` to its managed path.
+        """
+        placed: dict[str, Path] = {}
+        for src in sources:
+            key = str(src)
+            if key not in placed:
+                placed[key] = self.put(src)
+        return placed
+
+    def _ingest(self, src: Path, dst: Path) -> None:
+        if self.mode in ("link", "auto"):
+            try:
+                os.link(src, dst)
+                return
+            except OSError:
+                if self.mode == "link":
+                    raise
+        if self.mode in ("reflink", "auto"):
+            try:
+                _reflink(src, dst)
+                return
+            except (ImportError, OSError):
+                if self.mode == "reflink":
+                    raise
+        _copy_file(src, dst)
+
 
 # =========================================================
 # Blocks
 # =========================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class Table:
     """Structured table data for reports."""
 
@@ -143,22 +337,42 @@ class Table:
     @classmethod
     def from_dicts(cls, rows: Iterable[dict[str, Any]]) -> Table:
         """Create a table from a sequence of dictionaries."""
-        rows_l = list(rows)
-        headers = list(rows_l[0].keys()) if rows_l else []
-        body = [[row.get(h, "") for h in headers] for row in rows_l]
+        it = iter(rows)
+        first = next(it, None)
+        if first is None:
+            return cls([], [])
+        headers = list(first.keys())
+        # itemgetter returns a bare value (not a tuple) for a single key
+        _GETTER_MIN_KEYS = 2
+        if len(headers) < _GETTER_MIN_KEYS:
+            body = [[row.get(h, "") for h in headers] for row in chain((first,), it)]
+            return cls(headers, body)
+        getter = itemgetter(*headers)
+        header_keys = first.keys()
+        body = [list(getter(first))]
+        body.extend(
+            list(getter(row)) if row.keys() >= header_keys else [row.get(h, "") for h in headers]
+            for row in it
+        )
         return cls(headers, body)
 
     def to_markdown(self) -> str:
         """Serialize the table as GitHub-Flavored Markdown."""
         if not self.headers:
             return ""
-        header = "| " + " | ".join(map(_md_escape_cell, self.headers)) + " |"
-        sep = "| " + " | ".join("---" for _ in self.headers) + " |"
-        body = "\n".join("| " + " | ".join(_md_escape_cell(c) for c in r) + " |" for r in self.rows)
-        return f"{header}\n{sep}\n{body}\n"
+        parts: list[str] = [
+            "| ",
+            " | ".join(map(_md_escape_cell, self.headers)),
+            " |\n| ",
+            " | ".join(["---"] * len(self.headers)),
+            " |\n",
+        ]
+        # Header-only tables keep their trailing blank body line
+        parts.append(_md_table_body(self.rows) if self.rows else "\n")
+        return "".join(parts)
 
 
-@dataclass
+@dataclass(slots=True)
 class Image:
     """Image asset with optional alt/caption/width hints."""
 
@@ -168,23 +382,29 @@ class Image:
     width: int | str | None = None
     pdf_style: dict[str, Any] = field(default_factory=dict)
 
-    def to_markdown(self) -> str:
-        """Render the image as Markdown/HTML."""
-        md = f"![{self.alt}]({self.path})"
+    def to_markdown(self, *, path: str | None = None) -> str:
+        """Render the image as Markdown/HTML, optionally pointing at a relocated ``path``."""
         if self.caption or self.width is not None:
-            # Use HTML wrapper for width/caption while keeping MD-compatible core
-            width_attr: str | None = None
-            if isinstance(self.width, int):
-                width_attr = f"{self.width}px"
-            elif isinstance(self.width, str):
-                width_attr = self.width
-            style = f' style="width:{width_attr};"' if width_attr else ""
-            cap = f"<figcaption>{self.caption}</figcaption>" if self.caption else ""
-            return f"<figure{style}>{md}{cap}</figure>"
-        return md
-
-
-@dataclass
+            return self._to_md_figure(path or self.path)
+        return self._to_md_plain(path or self.path)
+
+    def _to_md_plain(self, path: str) -> str:
+        return f"![{self.alt}]({path})"
+
+    def _to_md_figure(self, path: str) -> str:
+        # Use HTML wrapper for width/caption while keeping MD-compatible core
+        width = self.width
+        width_attr: str | None = None
+        if isinstance(width, int):
+            width_attr = f"{width}px"
+        elif isinstance(width, str):
+            width_attr = width
+        style = f' style="width:{width_attr};"' if width_attr else ""
+        cap = f"<figcaption>{self.caption}</figcaption>" if self.caption else ""
+        return f"<figure{style}>![{self.alt}]({path}){cap}</figure>"
+
+
+@dataclass(slots=True)
 class PageBreak:
     """Explicit page break marker for rendered outputs."""
 
@@ -195,8 +415,7 @@ class PageBreak:
 
 PAGE_BREAK = PageBreak()
 
-
-@dataclass
+@dataclass(slots=True)
 class DataFrameBlock:
     """Wrapper for pandas-like data to render as a table."""
 
@@ -237,7 +456,7 @@ Block = Union[
 ]
 
 
-@dataclass
+@dataclass(slots=True)
 class FigureBlock:
     """Figure that combines an Image with caption/label info."""
 
@@ -245,9 +464,10 @@ class FigureBlock:
     caption: str | None = None
     label: str | None = None
     numbered: bool = True
+    _mf_label_text: str | None = field(default=None, init=False, repr=False, compare=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class TableBlock:
     """Table plus caption/label metadata."""
 
@@ -255,9 +475,10 @@ class TableBlock:
     caption: str | None = None
     label: str | None = None
     numbered: bool = False
+    _mf_label_text: str | None = field(default=None, init=False, repr=False, compare=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class LayoutBlock:
     """Group of blocks that should share a specific layout template."""
 
@@ -267,7 +488,7 @@ class LayoutBlock:
     page_break_after: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class InteractiveFigure:
     """Wrapper for matplotlib/plotly hybrid figures."""
 
@@ -275,7 +496,7 @@ class InteractiveFigure:
     plotly_figure: dict[str, Any] | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Section:
     """Hierarchical building block containing text, tables, and figures."""
 
@@ -284,7 +505,6 @@ class Section:
     level: int = 2  # 1..6; Report controls top-level
     pdf_style: dict[str, Any] = field(default_factory=dict)
     anchor: str | None = None
-
     # ----- block adders -----
     def add_text(self, *paragraphs: str) -> Section:
         """Append one or more paragraphs of text."""
@@ -360,31 +580,23 @@ class Section:
     # ----- common markdown constructs -----
     def add_bullets(self, items: Iterable[str]) -> Section:
         """Add a simple unordered bullet list from an iterable of strings."""
-        lst = "\n".join(f"- {x!s}" for x in items)
-        if lst:
-            self.blocks.append(lst)
+        items_list = list(items)
+        if items_list:
+            self.blocks.append("- " + "\n- ".join(map(str, items_list)))
         return self
 
     def add_checklist(self, items: Iterable[tuple[str, bool]]) -> Section:
         """Add a checklist where each item is (text, checked)."""
-        lst = "\n".join(f"- [{'x' if done else ' '}] {text}" for (text, done) in items)
+        lst = "\n".join(f"{_CHECKLIST_PREFIX[bool(done)]}{text}" for text, done in items)
         if lst:
             self.blocks.append(lst)
         return self
 
     def add_codeblock(self, code_text: str, language: str | None = None) -> Section:
         """Add a fenced code block with optional language (robust against ``` inside)."""
-        max_ticks = CODE_FENCE_MIN
-        run = 0
-        for ch in code_text:
-            if ch == "`":
-                run += 1
-                max_ticks = max(run, max_ticks)
-            else:
-                run = 0
-        fence = "`" * (max_ticks if max_ticks > CODE_FENCE_MIN else CODE_FENCE_MIN)
-        if "```" in code_text and len(fence) == CODE_FENCE_MIN:
-            fence = "````"
+        max_ticks = max((len(m.group(0)) for m in _BACKTICK_RUN.finditer(code_text)), default=0)
+        # The fence must be strictly longer than any backtick run inside the code
+        fence = "`" * max(max_ticks + 1, CODE_FENCE_MIN)
         lang = language or ""
         block = f"{fence}{lang}\n{code_text}\n{fence}"
         self.blocks.append(block)
@@ -448,11 +660,10 @@ class Section:
         - alt/caption/width: forwarded to Image()
         - dpi: DPI used when saving
         """
-        fig = None
-        if hasattr(obj, "savefig") and callable(getattr(obj, "savefig", None)):
+        if callable(getattr(obj, "savefig", None)):
             fig = obj
-        elif hasattr(obj, "figure") and getattr(obj, "figure", None) is not None:
-            fig = obj.figure
+        elif (parent := getattr(obj, "figure", None)) is not None:
+            fig = parent
         else:
             raise TypeError("add_matplotlib expects a matplotlib Figure or Axes")
 
@@ -460,7 +671,10 @@ class Section:
         base.mkdir(parents=True, exist_ok=True)
         fname = filename or f"mpl_{len(self.blocks)}.png"
         out_path = base / fname
-        fig.savefig(str(out_path), dpi=dpi, bbox_inches="tight")
+        # Encode in memory so the file lands with a single write
+        buf = io.BytesIO()
+        fig.savefig(buf, format="png", dpi=dpi, bbox_inches="tight")
+        out_path.write_bytes(buf.getvalue())
         plotly_payload: dict[str, Any] | None = None
         if interactive:
             try:
@@ -588,54 +802,146 @@ class Section:
         return self
 
     # ----- render to markdown -----
-    def to_markdown(self) -> str:
-        """Render this section (and nested sections) to Markdown."""
+    def to_markdown(self, *, image_paths: Mapping[int, str] | None = None) -> str:
+        """Render this section (and nested sections) to Markdown.
+
+        ``image_paths`` maps ``id(image)`` to a replacement path, letting callers
+        relocate assets without mutating the Image blocks.
+        """
+        if image_paths is None:
+            image_paths = _NO_IMAGE_PATHS
+        return self._render_markdown(image_paths)
+
+    def _render_markdown(self, image_paths: Mapping[int, str]) -> str:
         self.anchor = self.anchor or _slug(self.title)
-        lines: list[str] = [f"{'#' * self.level} {self.title}"]
-        lines.append(f"<a id='{self.anchor}'></a>")
-        lines.append("")
+        level = self.level
+        prefix = _HEADER_PREFIXES[level] if 0 <= level < len(_HEADER_PREFIXES) else "#" * level + " "
+        lines: list[str] = [prefix + self.title, f"<a id='{self.anchor}'></a>", ""]
+        child_level = min(level + 1, 6)
         for blk in self.blocks:
-            # Custom per-type rendering
-            if isinstance(blk, str):
-                lines += [blk, ""]
-            elif isinstance(blk, Table | Image):
-                lines += [blk.to_markdown(), ""]
-            elif isinstance(blk, InteractiveFigure):
-                lines += [blk.figure.image.to_markdown(), ""]
-                caption = blk.figure.caption or blk.figure.image.caption
-                label_text = getattr(blk.figure, "_mf_label_text", "Figure")
-                if caption:
-                    lines += [f"**{label_text}:** {caption}", ""]
-            elif isinstance(blk, FigureBlock):
-                lines += [blk.image.to_markdown(), ""]
-                label_text = getattr(blk, "_mf_label_text", "Figure")
-                caption = blk.caption or blk.image.caption
-                if caption:
-                    lines += [f"**{label_text}:** {caption}", ""]
-            elif isinstance(blk, PageBreak | DataFrameBlock):
-                lines += [blk.to_markdown(), ""]
-            elif isinstance(blk, TableBlock):
-                lines += [blk.table.to_markdown(), ""]
-                label_text = getattr(blk, "_mf_label_text", "Table")
-                if blk.caption:
-                    lines += [f"*{label_text}:* {blk.caption}", ""]
-            elif isinstance(blk, Section):
+            if type(blk) is str:
+                # Prose dominates most reports; skip the dispatch lookup and call
+                lines.extend((blk, ""))
+                continue
+            if isinstance(blk, Section):
                 # ensure nested section levels don't exceed h6
-                blk.level = min(self.level + 1, 6)
-                lines += [blk.to_markdown(), ""]
+                blk.level = child_level
+            handler = _MD_BLOCK_RENDERERS.get(type(blk)) or _md_renderer_for(type(blk))
+            if handler is not None:
+                handler(blk, lines, image_paths)
             elif isinstance(blk, MarkdownRenderable) or hasattr(blk, "to_markdown"):
-                # Protocol/fallback: any custom block with to_markdown()
+                # Protocol/fallback: subclasses and any custom block with to_markdown()
                 with suppress(Exception):
-                    lines += [blk.to_markdown(), ""]  # type: ignore[attr-defined]
+                    lines.extend((blk.to_markdown(), ""))  # type: ignore[attr-defined]
         return "\n".join(lines).strip()
 
 
+# ----- per-type Markdown renderers (Section.to_markdown dispatch) -----
+
+_MarkdownHandler = Callable[[Any, list[str], Mapping[int, str]], None]
+_NO_IMAGE_PATHS: Mapping[int, str] = MappingProxyType({})
+
+
+def _md_text(blk: str, lines: list[str], image_paths: Mapping[int, str]) -> None:
+    lines.extend((blk, ""))
+
+
+def _md_self(blk: Any, lines: list[str], image_paths: Mapping[int, str]) -> None:
+    lines.extend((blk.to_markdown(), ""))
+
+
+def _md_image(blk: Image, lines: list[str], image_paths: Mapping[int, str]) -> None:
+    lines.extend((blk.to_markdown(path=image_paths.get(id(blk))), ""))
+
+
+def _md_section(blk: Section, lines: list[str], image_paths: Mapping[int, str]) -> None:
+    lines.extend((blk._render_markdown(image_paths), ""))
+
+
+def _md_figure(blk: FigureBlock, lines: list[str], image_paths: Mapping[int, str]) -> None:
+    lines.extend((blk.image.to_markdown(), ""))
+    label_text = blk._mf_label_text or "Figure"
+    caption = blk.caption or blk.image.caption
+    if caption:
+        lines.extend((f"**{label_text}:** {caption}", ""))
+
+
+def _md_interactive(
+    blk: InteractiveFigure, lines: list[str], image_paths: Mapping[int, str]
+) -> None:
+    _md_figure(blk.figure, lines, image_paths)
+
+
+def _md_table_block(blk: TableBlock, lines: list[str], image_paths: Mapping[int, str]) -> None:
+    lines.extend((blk.table.to_markdown(), ""))
+    label_text = blk._mf_label_text or "Table"
+    if blk.caption:
+        lines.extend((f"*{label_text}:* {blk.caption}", ""))
+
+
+# Keyed by exact type; anything else falls back to the to_markdown() protocol
+_MD_BLOCK_RENDERERS: dict[type, _MarkdownHandler] = {
+    str: _md_text,
+    Table: _md_self,
+    Image: _md_image,
+    InteractiveFigure: _md_interactive,
+    FigureBlock: _md_figure,
+    PageBreak: _md_self,
+    DataFrameBlock: _md_self,
+    TableBlock: _md_table_block,
+    Section: _md_section,
+}
+
+
+def _md_renderer_for(typ: type) -> _MarkdownHandler | None:
+    """Resolve a renderer for subclasses of the built-in block types."""
+    for base in typ.__mro__[1:]:
+        handler = _MD_BLOCK_RENDERERS.get(base)
+        if handler is not None:
+            return handler
+    return None
+
+
+_EXHAUSTED = object()  # sentinel for next() in iterative block walks
+# Blocks that take part in figure/table numbering (see Report._ensure_label_index)
+_LABELED_BLOCKS = (FigureBlock, TableBlock, InteractiveFigure)
+
+
+_PDF_BUFFERS = threading.local()  # per-thread scratch BytesIO for Report._pdf_bytes
+
+# configure_pdf() keys copied verbatim onto the PDFTemplate attribute of the same name
+_PDF_DIRECT_ATTRS = frozenset(
+    {
+        "page_size",
+        "margin_left",
+        "margin_right",
+        "margin_top",
+        "margin_bottom",
+        "layout",
+        "first_page_layout",
+        "column_gap",
+        "font",
+        "font_bold",
+        "mono_font",
+        "base_font_size",
+        "h1",
+        "h2",
+        "h3",
+        "line_spacing",
+        "header_fn",
+        "footer_fn",
+        "autoscale_images",
+        "autoscale_tables",
+    }
+)
+
+
 # =========================================================
 # Report
 # =========================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class Report:
     """Top-level container holding sections plus render configuration."""
 
@@ -663,11 +969,27 @@ class Report:
     _st: Any | None = field(default=None, repr=False, compare=False)
     _citation_index: dict[str, int] = field(default_factory=dict, init=False, repr=False)
     _citation_order: list[str] = field(default_factory=list, init=False, repr=False)
+    _citation_str: dict[str, str] = field(default_factory=dict, init=False, repr=False)
     _label_index: dict[str, str] = field(default_factory=dict, init=False, repr=False)
+    _dash_scaffold: tuple[tuple[str | None, ...], tuple[Any, ...]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _html_cache: tuple[str, str, str] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _streamlit_css_cache: tuple[dict[str, str], str] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     # ---------- PDF ----------
-    def write_pdf(self, path: str, template: PDFTemplate | None = None) -> str:  # type: ignore[name-defined]
-        """Render this report to a PDF using the provided (or default) template."""
+    def write_pdf(
+        self, path: str | BinaryIO, template: PDFTemplate | None = None  # type: ignore[name-defined]
+    ) -> str | BinaryIO:
+        """Render this report to a PDF using the provided (or default) template.
+
+        ``path`` may also be a binary file-like object (e.g. ``io.BytesIO``), which
+        ReportLab writes to directly. Returns ``path``.
+        """
         self._ensure_label_index()
         from .render import PDFTemplate, report_to_pdf  # local import to avoid circular dependency
 
@@ -676,6 +998,17 @@ class Report:
         self._apply_pdf_template_overrides(tpl, user_template=supplied_template)
         return report_to_pdf(self, out_pdf_path=path, template=tpl)
 
+    def _pdf_bytes(self) -> bytes:
+        """Render the PDF into memory and return the bytes."""
+        # One scratch buffer per thread, rewound instead of reallocated per render
+        buf = getattr(_PDF_BUFFERS, "buf", None)
+        if buf is None:
+            buf = _PDF_BUFFERS.buf = io.BytesIO()
+        buf.seek(0)
+        buf.truncate()
+        self.write_pdf(buf)
+        return buf.getvalue()
+
     def configure_pdf(self, **options) -> Report:
         """Configure PDF-level layout defaults without manually creating a template.
 
@@ -719,17 +1052,25 @@ class Report:
         return self
 
     # ---------- utils ----------
-    def walk(self) -> Iterable[Section]:
+    def walk(self) -> Iterator[Section]:
         """Yield every section/subsection in depth-first order."""
-
-        def _rec(s: Section):
-            yield s
-            for b in s.blocks:
+        stack = self.sections[::-1]
+        while stack:
+            sec = stack.pop()
+            yield sec
+            for b in reversed(sec.blocks):
                 if isinstance(b, Section):
-                    yield from _rec(b)
-
-        for s in self.sections:
-            yield from _rec(s)
+                    stack.append(b)
+
+    def _walk_sections(self) -> Iterator[tuple[Section, int]]:
+        """Yield ``(section, depth)`` pairs in depth-first order."""
+        stack: list[tuple[Section, int]] = [(s, 0) for s in reversed(self.sections)]
+        while stack:
+            sec, depth = stack.pop()
+            yield sec, depth
+            for b in reversed(sec.blocks):
+                if isinstance(b, Section):
+                    stack.append((b, depth + 1))
 
     def _apply_pdf_template_overrides(self, template: PDFTemplate, *, user_template: bool) -> None:  # type: ignore[name-defined]
         """Apply configure_pdf overrides to the given template instance."""
@@ -763,34 +1104,11 @@ class Report:
             assign("margin_top", float(top))
             assign("margin_bottom", float(bottom))
 
-        direct_attrs = {
-            "page_size",
-            "margin_left",
-            "margin_right",
-            "margin_top",
-            "margin_bottom",
-            "layout",
-            "first_page_layout",
-            "column_gap",
-            "font",
-            "font_bold",
-            "mono_font",
-            "base_font_size",
-            "h1",
-            "h2",
-            "h3",
-            "line_spacing",
-            "header_fn",
-            "footer_fn",
-            "autoscale_images",
-            "autoscale_tables",
-        }
-        for attr in direct_attrs:
-            if attr in overrides:
-                assign(attr, overrides[attr])
+        for attr in overrides.keys() & _PDF_DIRECT_ATTRS:
+            assign(attr, overrides[attr])
 
         if "font_files" in overrides:
-            for name, path in dict(overrides["font_files"]).items():
+            for name, path in overrides["font_files"].items():
                 normalized = str(Path(path))
                 current = template.font_files.get(name)
                 if user_template and current and current != normalized:
@@ -802,7 +1120,7 @@ class Report:
 
         for style_key in ("figure_caption_style", "table_caption_style"):
             if style_key in overrides:
-                style_update = dict(overrides[style_key])
+                style_update = overrides[style_key]
                 base = getattr(template, style_key)
                 for key, value in style_update.items():
                     old = base.get(key)
@@ -811,7 +1129,7 @@ class Report:
                 base.update(style_update)
 
         if "paragraph_overrides" in overrides:
-            paragraph_update = dict(overrides["paragraph_overrides"])
+            paragraph_update = overrides["paragraph_overrides"]
             for key, value in paragraph_update.items():
                 old = template.paragraph_overrides.get(key)
                 if user_template and old != value:
@@ -844,69 +1162,56 @@ class Report:
     def _build_toc(self) -> list[str]:
         """Generate a Markdown-formatted table-of-contents."""
         toc = ["## Table of Contents", ""]
-
-        def _iter(sec: Section) -> Iterable[Section]:
-            yield sec
-            for blk in sec.blocks:
-                if isinstance(blk, Section):
-                    yield from _iter(blk)
-
-        for s in self.sections:
-            for sec in _iter(s):
-                indent = "  " * max(0, sec.level - 2)
-                anchor = sec.anchor or _slug(sec.title)
-                toc.append(f"{indent}- [{sec.title}](#{anchor})")
+        for sec in self.walk():
+            indent = "  " * max(0, sec.level - 2)
+            anchor = sec.anchor or _slug(sec.title)
+            toc.append(f"{indent}- [{sec.title}](#{anchor})")
         return toc
 
     def to_markdown(self, *, asset_base: Path | None = None) -> str:
         """Serialize the full report to Markdown."""
         self._ensure_label_index()
         dt = self.date_str or date.today().isoformat()
-        front_matter = [
-            "---",
-            f'title: "{self.title}"',
-            f'author: "{self.author}"' if self.author else None,
-            f"date: {dt}",
-            *(f"{k}: {v}" for k, v in self.meta.items()),
-            "---",
-            "",
-        ]
-        front = "\n".join([x for x in front_matter if x is not None])
+        front = "\n".join(
+            (
+                "---",
+                f'title: "{self.title}"',
+                *((f'author: "{self.author}"',) if self.author else ()),
+                f"date: {dt}",
+                *(f"{k}: {v}" for k, v in self.meta.items()),
+                "---",
+                "",
+            )
+        )
 
-        # Optionally relocate assets into a dedicated folder and rewrite paths temporarily
-        img_restore: list[tuple[Image, str]] = []
+        # Optionally relocate assets into a dedicated folder; rewritten paths live in a
+        # side table keyed by id(image) so the Image blocks themselves are never mutated
+        image_paths: dict[int, str] = {}
         if asset_base is not None:
-            am = AssetManager(base=Path(asset_base))
-            for sec in self.walk():
-                for _, blk in enumerate(list(sec.blocks)):
-                    if isinstance(blk, Image):
-                        try:
-                            newp = am.put(blk.path)
-                            img_restore.append((blk, blk.path))
-                            blk.path = str(Path(asset_base) / newp.name)
-                        except Exception:
-                            pass
+            images = [
+                blk
+                for sec, _ in self._walk_sections()
+                for blk in sec.blocks
+                if isinstance(blk, Image)
+            ]
+            placed = AssetManager(base=Path(asset_base)).put_many(img.path for img in images)
+            for img in images:
+                image_paths[id(img)] = str(Path(asset_base) / placed[str(img.path)].name)
 
         parts = [front, f"# {self.title}", ""]
         if self.author:
-            parts += [f"**Author:** {self.author}", ""]
-        parts += [f"*{dt}*", ""]
+            parts.extend((f"**Author:** {self.author}", ""))
+        parts.extend((f"*{dt}*", ""))
 
         # TOC
         toc = self._build_toc()
         _TOC_MIN_ENTRIES = 2
         if len(toc) > _TOC_MIN_ENTRIES:
-            parts += ["\n".join(toc), ""]
+            parts.extend(("\n".join(toc), ""))
 
         for s in self.sections:
-            parts += [s.to_markdown(), ""]
-        md = "\n".join(parts).strip()
-
-        # Restore original image paths
-        for blk, old in img_restore:
-            blk.path = old
-
-        return md
+            parts.extend((s.to_markdown(image_paths=image_paths), ""))
+        return "\n".join(parts).strip()
 
     def write_markdown(self, path: str | Path) -> str:
         """Write `to_markdown()` output to disk and return the path."""
@@ -924,16 +1229,15 @@ class Report:
             Report(title='Demo', headings=['Summary', 'Metrics', 'Notes > Todo'])
         """
         paths: list[str] = []
-
-        def walk(sec: Section, parent: list[str]) -> None:
-            full = [*parent, sec.title]
-            paths.append(" > ".join(full))
-            for blk in sec.blocks:
-                if isinstance(blk, Section):
-                    walk(blk, full)
-
-        for s in self.sections:
-            walk(s, [])
+        # Each stack entry carries its parent's full path string, built once per section
+        stack: list[tuple[Section, str | None]] = [(s, None) for s in reversed(self.sections)]
+        while stack:
+            sec, parent = stack.pop()
+            path = sec.title if parent is None else f"{parent} > {sec.title}"
+            paths.append(path)
+            for b in reversed(sec.blocks):
+                if isinstance(b, Section):
+                    stack.append((b, path))
 
         hs = ", ".join(repr(p) for p in paths)
         return f"Report(title={self.title!r}, headings=[{hs}])"
@@ -1014,8 +1318,61 @@ class Report:
         if css:
             theme["css"] = css
         self.streamlit_theme.update(theme)
+        self._streamlit_css()
         return self
 
+    def _html_for(self, md: str) -> str:
+        """Return the standalone HTML for ``md``, reusing the last conversion if unchanged."""
+        from .render import markdown_to_html
+
+        cached = self._html_cache
+        if cached is not None and cached[0] == self.title and cached[1] == md:
+            return cached[2]
+        html_doc = markdown_to_html(md, title=self.title)
+        self._html_cache = (self.title, md, html_doc)
+        return html_doc
+
+    def _streamlit_css(self) -> str:
+        """Return the CSS injected for `streamlit_theme`, cached until the theme changes."""
+        theme = self.streamlit_theme
+        cached = self._streamlit_css_cache
+        if cached is not None and cached[0] == theme:
+            return cached[1]
+        get = theme.get
+        bg, text, font = get("background_color"), get("text_color"), get("font_family")
+        link, secondary_bg = get("link_color"), get("secondary_background_color")
+        primary, extra_css = get("primary_color"), get("css")
+        rules = (
+            (
+                f"body {{{f' background-color: {bg};' if bg else ''}"
+                f"{f' color: {text};' if text else ''}"
+                f"{f' font-family: {font};' if font else ''} }}"
+            )
+            if bg or text or font
+            else None,
+            f"a, a:visited {{ color: {link}; }}" if link else None,
+            # Streamlit containers (best-effort selectors)
+            (
+                "[data-testid='stSidebar'], .sidebar .sidebar-content {"
+                f" background-color: {secondary_bg}; }}"
+            )
+            if secondary_bg
+            else None,
+            # Buttons and slider accents (best-effort)
+            (
+                ".stButton>button, .stDownloadButton>button {"
+                f" background-color: {primary}; border-color: {primary}; }}"
+            )
+            if primary
+            else None,
+            extra_css or None,
+        )
+        css_block = "\n".join(r for r in rules if r)
+        if not css_block.strip():
+            css_block = ""
+        self._streamlit_css_cache = (dict(theme), css_block)
+        return css_block
+
     def configure_dash(
         self,
         *,
@@ -1055,10 +1412,12 @@ class Report:
         """Return an IEEE-style numeric citation like [1], tracking order of first use."""
         if key not in self.references:
             raise KeyError(f"Reference '{key}' is not registered.")
-        if key not in self._citation_index:
+        cited = self._citation_str.get(key)
+        if cited is None:
             self._citation_order.append(key)
-            self._citation_index[key] = len(self._citation_order)
-        return f"[{self._citation_index[key]}]"
+            idx = self._citation_index[key] = len(self._citation_order)
+            cited = self._citation_str[key] = f"[{idx}]"
+        return cited
 
     def ensure_references_section(self, title: str = "References") -> Section:
         """Populate (or create) a references section ordered by citation usage."""
@@ -1075,6 +1434,10 @@ class Report:
     def _ensure_label_index(self) -> dict[str, str]:
         fig_prefix = self.meta.get("figure_prefix", "Figure")
         table_prefix = self.meta.get("table_prefix", "Table")
+        # Prose-only reports: a flat scan suffices, no numbering pass needed
+        if not any(isinstance(b, _LABELED_BLOCKS) for sec in self.walk() for b in sec.blocks):
+            self._label_index = {}
+            return self._label_index
         figure_counter = 0
         table_counter = 0
         label_index: dict[str, str] = {}
@@ -1103,19 +1466,20 @@ class Report:
             if block.label:
                 label_index[block.label] = label_text
 
-        def walk(sec: Section) -> None:
-            for blk in sec.blocks:
-                if isinstance(blk, InteractiveFigure):
-                    assign_figure(blk.figure)
-                elif isinstance(blk, FigureBlock):
-                    assign_figure(blk)
-                elif isinstance(blk, TableBlock):
-                    assign_table(blk)
-                elif isinstance(blk, Section):
-                    walk(blk)
-
-        for section in self.sections:
-            walk(section)
+        # Depth-first over blocks (nested sections numbered in place) via a stack of iterators
+        stack = [iter(sec.blocks) for sec in reversed(self.sections)]
+        while stack:
+            blk = next(stack[-1], _EXHAUSTED)
+            if blk is _EXHAUSTED:
+                stack.pop()
+            elif isinstance(blk, InteractiveFigure):
+                assign_figure(blk.figure)
+            elif isinstance(blk, FigureBlock):
+                assign_figure(blk)
+            elif isinstance(blk, TableBlock):
+                assign_table(blk)
+            elif isinstance(blk, Section):
+                stack.append(iter(blk.blocks))
 
         self._label_index = label_index
         return label_index
@@ -1156,10 +1520,6 @@ class Report:
 
         # Build artifacts once
         md = self.to_markdown()
-        try:
-            from .render import markdown_to_html
-        except Exception as e:  # pragma: no cover
-            raise RuntimeError("Render helpers unavailable.") from e
 
         # Options (with reasonable defaults)
         page_title = self.streamlit_options.get("page_title", f"EasyPour — {self.title}")
@@ -1172,42 +1532,8 @@ class Report:
             st.set_page_config(page_title=page_title, layout=layout)
 
         # Apply simple theme via CSS injection if provided
-        if self.streamlit_theme:
-            rules: list[str] = []
-            bg = self.streamlit_theme.get("background_color")
-            text = self.streamlit_theme.get("text_color")
-            link = self.streamlit_theme.get("link_color")
-            font = self.streamlit_theme.get("font_family")
-            secondary_bg = self.streamlit_theme.get("secondary_background_color")
-            primary = self.streamlit_theme.get("primary_color")
-            if bg or text or font:
-                rules.append(
-                    "body {"
-                    + (f" background-color: {bg};" if bg else "")
-                    + (f" color: {text};" if text else "")
-                    + (f" font-family: {font};" if font else "")
-                    + " }"
-                )
-            if link:
-                rules.append(f"a, a:visited {{ color: {link}; }}")
-            # Streamlit containers (best-effort selectors)
-            if secondary_bg:
-                rules.append(
-                    "[data-testid='stSidebar'], .sidebar .sidebar-content {"
-                    + f" background-color: {secondary_bg};"
-                    + " }"
-                )
-            if primary:
-                # Buttons and slider accents (best-effort)
-                rules.append(
-                    ".stButton>button, .stDownloadButton>button {"
-                    + f" background-color: {primary}; border-color: {primary};"
-                    + " }"
-                )
-            extra_css = self.streamlit_theme.get("css")
-            css_block = "\n".join(rules + ([extra_css] if extra_css else []))
-            if css_block.strip():
-                st.markdown(f"<style>{css_block}</style>", unsafe_allow_html=True)
+        if css_block := self._streamlit_css():
+            st.markdown(f"<style>{css_block}</style>", unsafe_allow_html=True)
 
         st.title(self.title)
         if self.author:
@@ -1232,10 +1558,6 @@ class Report:
         tabs_created = st.tabs(tabs)  # type: ignore[assignment]
         tab_lookup = {name: tabs_created[i] for i, name in enumerate(tabs)}
 
-        def _stable_key(*parts: str) -> str:
-            h = hashlib.md5("||".join(parts).encode()).hexdigest()[:10]
-            return f"k_{h}"
-
         def _display_image_block(img: Image):
             use_container = None
             w_px: int | None = None
@@ -1273,60 +1595,92 @@ class Report:
                 st.markdown(f"{'#' * sec.level} {sec.title}")
 
             for blk in sec.blocks:
-                # Custom renderer mapping by exact type
-                r_fn = self.streamlit_renderers.get(type(blk))
+                typ = type(blk)
+                # Custom renderer registered for this type (or its nearest base class)
+                r_fn = _custom_renderer_for(typ)
                 if r_fn is not None:
                     try:
                         r_fn(st, blk, self)
                         continue
                     except Exception as e:
-                        st.warning(f"Custom renderer failed for {type(blk).__name__}: {e}")
+                        st.warning(f"Custom renderer failed for {typ.__name__}: {e}")
 
-                if isinstance(blk, str):
-                    st.markdown(blk, unsafe_allow_html=True)
-                elif isinstance(blk, Image):
-                    _display_image_block(blk)
-                elif isinstance(blk, Table):
+                handler = st_dispatch.get(typ) or _st_handler_for(typ)
+                if handler is not None:
+                    handler(blk)
+                elif isinstance(blk, MarkdownRenderable) or hasattr(blk, "to_markdown"):
                     try:
-                        import pandas as pd  # type: ignore
-
-                        df = pd.DataFrame(blk.rows, columns=blk.headers)
-                        st.table(df)
+                        st.markdown(blk.to_markdown(), unsafe_allow_html=True)  # type: ignore[attr-defined]
                     except Exception:
-                        st.table([dict(zip(blk.headers, r, strict=False)) for r in blk.rows])
-                elif isinstance(blk, InteractiveFigure):
+                        st.warning(f"Could not render custom block: {typ.__name__}")
+
+        def _st_text(blk: str) -> None:
+            st.markdown(blk, unsafe_allow_html=True)
+
+        def _st_table(blk: Table) -> None:
+            try:
+                import pandas as pd  # type: ignore
+
+                df = pd.DataFrame(blk.rows, columns=blk.headers)
+                st.table(df)
+            except Exception:
+                # Stream rows instead of materializing a second list of dicts
+                st.table(dict(zip(blk.headers, r, strict=False)) for r in blk.rows)
+
+        def _st_interactive(blk: InteractiveFigure) -> None:
+            displayed = False
+            if blk.plotly_figure:
+                try:
+                    import plotly.graph_objects as go  # type: ignore
+
+                    st.plotly_chart(go.Figure(blk.plotly_figure), use_container_width=True)
+                    displayed = True
+                except Exception:
                     displayed = False
-                    if blk.plotly_figure:
-                        try:
-                            import plotly.graph_objects as go  # type: ignore
+            if not displayed:
+                _display_image_block(blk.figure.image)
+            if blk.figure.caption:
+                st.caption(blk.figure.caption)
 
-                            st.plotly_chart(go.Figure(blk.plotly_figure), use_container_width=True)
-                            displayed = True
-                        except Exception:
-                            displayed = False
-                    if not displayed:
-                        _display_image_block(blk.figure.image)
-                    if blk.figure.caption:
-                        st.caption(blk.figure.caption)
-                elif isinstance(blk, DataFrameBlock):
-                    try:
-                        import pandas as pd  # type: ignore
+        def _st_dataframe(blk: DataFrameBlock) -> None:
+            try:
+                import pandas as pd  # type: ignore
 
-                        st.dataframe(pd.DataFrame(blk.data))
-                        if blk.caption:
-                            st.caption(blk.caption)
-                    except Exception:
-                        st.text("(DataFrame unavailable)")
-                elif isinstance(blk, PageBreak):
-                    # No-op in Streamlit; keep layout simple
-                    st.divider()
-                elif isinstance(blk, Section):
-                    _render_section(blk)
-                elif isinstance(blk, MarkdownRenderable) or hasattr(blk, "to_markdown"):
-                    try:
-                        st.markdown(blk.to_markdown(), unsafe_allow_html=True)  # type: ignore[attr-defined]
-                    except Exception:
-                        st.warning(f"Could not render custom block: {type(blk).__name__}")
+                st.dataframe(pd.DataFrame(blk.data))
+                if blk.caption:
+                    st.caption(blk.caption)
+            except Exception:
+                st.text("(DataFrame unavailable)")
+
+        def _st_page_break(blk: PageBreak) -> None:
+            # No-op in Streamlit; keep layout simple
+            st.divider()
+
+        # Built once per call: exact-type dispatch, with MRO fallbacks memoized per type
+        st_dispatch: dict[type, Callable[[Any], None]] = {
+            str: _st_text,
+            Image: _display_image_block,
+            Table: _st_table,
+            InteractiveFigure: _st_interactive,
+            DataFrameBlock: _st_dataframe,
+            PageBreak: _st_page_break,
+            Section: _render_section,
+        }
+        custom_by_type: dict[type, Callable[[Any, Any, Report], None] | None] = {}
+
+        def _st_handler_for(typ: type) -> Callable[[Any], None] | None:
+            handler = next((st_dispatch[b] for b in typ.__mro__[1:] if b in st_dispatch), None)
+            if handler is not None:
+                st_dispatch[typ] = handler
+            return handler
+
+        def _custom_renderer_for(typ: type) -> Callable[[Any, Any, Report], None] | None:
+            if typ not in custom_by_type:
+                renderers = self.streamlit_renderers
+                custom_by_type[typ] = next(
+                    (renderers[b] for b in typ.__mro__ if b in renderers), None
+                )
+            return custom_by_type[typ]
 
         if "Report" in tab_lookup:
             with tab_lookup["Report"]:
@@ -1339,44 +1693,47 @@ class Report:
 
         if "HTML" in tab_lookup:
             with tab_lookup["HTML"]:
-                html_doc = markdown_to_html(md, title=self.title)
+                html_doc = self._html_for(md)
                 # Convert relative img src to file URIs so iframe can load them
                 try:
-                    from pathlib import Path as _P
 
                     def _repl(m):
                         p = m.group(1)
-                        if p.startswith("http://") or p.startswith("https://"):
+                        if p.startswith(("http://", "https://")):
                             return m.group(0)
-                        q = _P(p)
-                        if not q.is_absolute():
-                            q = _P(".").joinpath(q)
+                        q = Path(p)
                         if q.exists():
                             return f'src="{q.resolve().as_uri()}"'
                         return m.group(0)
 
-                    html_doc = re.sub(r'src="([^"]+)"', _repl, html_doc)
+                    html_doc = _SRC_RE.sub(_repl, html_doc)
                 except Exception:
                     pass
                 st.components.v1.html(html_doc, height=height, scrolling=True)
 
         if "PDF" in tab_lookup:
             with tab_lookup["PDF"]:
-                # Generate a PDF on demand; degrade gracefully if ReportLab missing
-                import tempfile
-
-                try:
-                    with tempfile.NamedTemporaryFile(suffix=".pdf") as tmp:
-                        self.write_pdf(tmp.name)
-                        data = Path(tmp.name).read_bytes()
+                # Streamlit reruns every tab body on each interaction, so only build the
+                # PDF on request. The button is always shown: PDF-only inputs (styles,
+                # spacing, regenerated image files) can change without touching the
+                # Markdown, so the user decides when the kept bytes are stale.
+                pdf_key = _stable_key("pdf", self.title)
+                cached = st.session_state.get(pdf_key)
+                if cached is not None and cached[0] != md:
+                    cached = None
+                label = "Generate PDF" if cached is None else "Rebuild PDF"
+                if st.button(label, key=f"{pdf_key}_build"):
+                    try:
+                        cached = st.session_state[pdf_key] = (md, self._pdf_bytes())
+                    except Exception:
+                        st.info("PDF generation is unavailable. Install ReportLab to enable.")
+                if cached is not None:
                     st.download_button(
                         "Download PDF",
-                        data=data,
+                        data=cached[1],
                         file_name="report.pdf",
                         mime="application/pdf",
                     )
-                except Exception:
-                    st.info("PDF generation is unavailable. Install ReportLab to enable.")
 
         # Hook after rendering content
         if (hook := self.streamlit_hooks.get("after_render")) is not None:
@@ -1389,20 +1746,17 @@ class Report:
         """Return a Dash app mirroring this report with interactive widgets."""
         self._ensure_label_index()
 
+        # Imported lazily so `import easypour` never pays for Dash
         try:
             from dash import Dash, Input, Output, dcc, html  # type: ignore
-
-            try:
-                from dash import dash_table  # type: ignore
-            except Exception:
-                dash_table = None  # type: ignore
-        except Exception as e:  # pragma: no cover - dependency missing
+        except ImportError as e:  # pragma: no cover - dependency missing
             raise ImportError("Dash is required: pip install dash") from e
-
-        from .render import markdown_to_html
+        try:
+            from dash import dash_table  # type: ignore
+        except ImportError:
+            dash_table = None  # type: ignore
 
         md_text = self.to_markdown()
-        html_doc = markdown_to_html(md_text, title=self.title)
         external = self.dash_options.get("external_stylesheets")
         app = Dash(__name__, external_stylesheets=external)
         app.title = self.dash_options.get("page_title", f"EasyPour — {self.title}")
@@ -1412,40 +1766,75 @@ class Report:
         pdf_button_id: str | None = None
         pdf_download_id: str | None = None
 
-        def _stable_id(*parts: str) -> str:
-            h = hashlib.md5("||".join(parts).encode()).hexdigest()[:10]
-            return f"mf_{h}"
+        # Resolved once per build: repeated paths cost neither a read nor a stat
+        image_srcs: dict[str, str] = {}
 
         def _image_src(path: str) -> str:
+            src = image_srcs.get(path)
+            if src is None:
+                src = image_srcs[path] = _load_image_src(path)
+            return src
+
+        def _load_image_src(path: str) -> str:
+            if isinstance(path, str) and path.startswith(_INLINE_OR_REMOTE_SRC):
+                return path
             try:
-                p = Path(path)
-                if not p.exists():
-                    return path
-                data = base64.b64encode(p.read_bytes()).decode("ascii")
-                mime, _ = mimetypes.guess_type(p.name)
-                return f"data:{mime or 'image/png'};base64,{data}"
+                st = os.stat(path)
+            except (OSError, ValueError):
+                return path
+            try:
+                return _data_uri(str(path), st.st_mtime_ns, st.st_size)
             except Exception:
                 return path
 
-        def _table_component(headers: list[str], rows: list[list[Any]]):
+        def _table_component(
+            headers: list[str],
+            rows: list[list[Any]] | None = None,
+            *,
+            records: list[dict[str, Any]] | None = None,
+        ):
             if dash_table is not None:
-                data = [dict(zip(headers, r, strict=False)) for r in rows]
+                if records is None:
+                    # C-level map/zip/dict pipeline; no per-row Python frame
+                    records = list(map(dict, map(zip, repeat(headers), rows or ())))
                 columns = [{"name": h, "id": h} for h in headers]
                 return dash_table.DataTable(
                     columns=columns,
-                    data=data,
+                    data=records,
                     style_table={"overflowX": "auto"},
                     style_cell={"textAlign": "left", "padding": "6px"},
                     style_header={"backgroundColor": "#f5f5f5", "fontWeight": "bold"},
                 )
             # Fallback plain HTML table
             header_cells = [html.Th(h) for h in headers]
-            body_rows = [html.Tr([html.Td(str(cell)) for cell in row]) for row in rows]
+            body_rows = [html.Tr([html.Td(str(cell)) for cell in row]) for row in rows or ()]
             return html.Table(
                 [html.Thead(html.Tr(header_cells)), html.Tbody(body_rows)], className="mf-table"
             )
 
+        # Identical tables/images reused across sections share one component per build
+        component_cache: dict[tuple[Any, ...], Any] = {}
+
+        def _cached_table_component(headers: list[str], rows: list[list[Any]]):
+            try:
+                key = ("table", tuple(headers), tuple(map(tuple, rows)))
+                hash(key)
+            except TypeError:
+                # Unhashable cells: render without sharing
+                return _table_component(headers, rows)
+            comp = component_cache.get(key)
+            if comp is None:
+                comp = component_cache[key] = _table_component(headers, rows)
+            return comp
+
         def _image_component(img: Image, caption: str | None = None):
+            key = ("image", img.path, img.width, caption or img.caption)
+            comp = component_cache.get(key)
+            if comp is None:
+                comp = component_cache[key] = _build_image_component(img, caption)
+            return comp
+
+        def _build_image_component(img: Image, caption: str | None = None):
             width = None
             if isinstance(img.width, int):
                 width = f"{img.width}px"
@@ -1459,61 +1848,84 @@ class Report:
                 fig_children.append(html.Figcaption(cap))
             return html.Figure(fig_children, className="mf-image")
 
+        headings = (html.H1, html.H2, html.H3, html.H4, html.H5, html.H6)
+
         def _render_section(sec: Section) -> html.Div:
-            heading_map = {
-                1: html.H1,
-                2: html.H2,
-                3: html.H3,
-                4: html.H4,
-                5: html.H5,
-            }
-            heading_cls = heading_map.get(sec.level, html.H6)
+            heading_cls = headings[max(1, min(sec.level, len(headings))) - 1]
             children: list[Any] = [heading_cls(sec.title)]
-            for idx, blk in enumerate(sec.blocks):
-                children.extend(_render_block(sec, blk, idx))
+            for blk in sec.blocks:
+                _render_block(blk, children)
             return html.Div(children, className=f"mf-section level-{sec.level}")
 
-        def _render_block(sec: Section, blk: Any, index: int) -> list[Any]:
-            elems: list[Any] = []
-            if isinstance(blk, str):
-                elems.append(dcc.Markdown(blk, className="mf-text"))
-            elif isinstance(blk, Table):
-                tbl = _table_component(blk.headers, blk.rows)
-                elems.append(html.Div(tbl, className="mf-table-wrap"))
-            elif isinstance(blk, Image):
-                elems.append(_image_component(blk))
-            elif isinstance(blk, InteractiveFigure):
-                if blk.plotly_figure:
-                    elems.append(
-                        html.Div(
-                            dcc.Graph(figure=blk.plotly_figure, config={"responsive": True}),
-                            className="mf-interactive-plot",
-                        )
+        def _dash_text(blk: str, out: list[Any]) -> None:
+            out.append(dcc.Markdown(blk, className="mf-text"))
+
+        def _dash_table(blk: Table, out: list[Any]) -> None:
+            tbl = _cached_table_component(blk.headers, blk.rows)
+            out.append(html.Div(tbl, className="mf-table-wrap"))
+
+        def _dash_image(blk: Image, out: list[Any]) -> None:
+            out.append(_image_component(blk))
+
+        def _dash_interactive(blk: InteractiveFigure, out: list[Any]) -> None:
+            if blk.plotly_figure:
+                out.append(
+                    html.Div(
+                        dcc.Graph(figure=blk.plotly_figure, config={"responsive": True}),
+                        className="mf-interactive-plot",
                     )
-                    if blk.figure.caption:
-                        elems.append(html.Figcaption(blk.figure.caption, className="mf-figcaption"))
+                )
+                if blk.figure.caption:
+                    out.append(html.Figcaption(blk.figure.caption, className="mf-figcaption"))
+            else:
+                out.append(_image_component(blk.figure.image, blk.figure.caption))
+
+        def _dash_page_break(blk: PageBreak, out: list[Any]) -> None:
+            out.append(html.Hr(className="mf-page-break"))
+
+        def _dash_dataframe(blk: DataFrameBlock, out: list[Any]) -> None:
+            try:
+                import pandas as pd  # type: ignore
+
+                df = blk.data if hasattr(blk.data, "columns") else pd.DataFrame(blk.data)
+                headers = list(df.columns)
+                if dash_table is not None:
+                    # pandas builds the records in C; skip the list-of-lists round-trip
+                    out.append(_table_component(headers, records=df.to_dict("records")))
                 else:
-                    elems.append(_image_component(blk.figure.image, blk.figure.caption))
-            elif isinstance(blk, PageBreak):
-                elems.append(html.Hr(className="mf-page-break"))
-            elif isinstance(blk, DataFrameBlock):
-                try:
-                    import pandas as pd  # type: ignore
+                    out.append(_table_component(headers, df.values.tolist()))
+            except Exception:
+                out.append(dcc.Markdown(blk.caption or "(DataFrame unavailable)"))
+
+        def _dash_section(blk: Section, out: list[Any]) -> None:
+            out.append(_render_section(blk))
+
+        # Exact-type dispatch; subclasses resolve via their MRO once and are memoized
+        dash_dispatch: dict[type, Callable[[Any, list[Any]], None]] = {
+            str: _dash_text,
+            Table: _dash_table,
+            Image: _dash_image,
+            InteractiveFigure: _dash_interactive,
+            PageBreak: _dash_page_break,
+            DataFrameBlock: _dash_dataframe,
+            Section: _dash_section,
+        }
 
-                    df = blk.data if hasattr(blk.data, "columns") else pd.DataFrame(blk.data)
-                    headers = list(df.columns)
-                    rows = df.values.tolist()
-                    elems.append(_table_component(headers, rows))
-                except Exception:
-                    elems.append(dcc.Markdown(blk.caption or "(DataFrame unavailable)"))
-            elif isinstance(blk, Section):
-                elems.append(_render_section(blk))
+        def _render_block(blk: Any, out: list[Any]) -> None:
+            """Append the component(s) for ``blk`` directly onto ``out``."""
+            typ = type(blk)
+            handler = dash_dispatch.get(typ)
+            if handler is None:
+                handler = next((dash_dispatch[b] for b in typ.__mro__[1:] if b in dash_dispatch), None)
+                if handler is not None:
+                    dash_dispatch[typ] = handler
+            if handler is not None:
+                handler(blk, out)
             elif hasattr(blk, "to_markdown"):
                 try:
-                    elems.append(dcc.Markdown(blk.to_markdown()))
+                    out.append(dcc.Markdown(blk.to_markdown()))
                 except Exception:
-                    elems.append(dcc.Markdown(str(blk)))
-            return elems
+                    out.append(dcc.Markdown(str(blk)))
 
         report_children = [_render_section(sec) for sec in self.sections] or [
             html.Div(dcc.Markdown("(No sections defined yet.)"), className="mf-empty")
@@ -1548,13 +1960,23 @@ class Report:
                     )
                 )
             elif name == "HTML":
+                # Serve the standalone HTML from its own route so it stays out of the
+                # layout JSON; it is only converted when the iframe first loads. A single
+                # path segment keeps relative src/href resolving against the app prefix,
+                # as they did with srcDoc.
+                preview_route = "easypour-html-preview"
+                app.server.add_url_rule(
+                    f"{app.config.routes_pathname_prefix}{preview_route}",
+                    endpoint="easypour_html_preview",
+                    view_func=lambda: self._html_for(md_text),
+                )
                 tab_components.append(
                     dcc.Tab(
                         label="HTML Preview",
                         value=value,
                         children=[
                             html.Iframe(
-                                srcDoc=html_doc,
+                                src=f"{app.config.requests_pathname_prefix}{preview_route}",
                                 style={
                                     "width": "100%",
                                     "height": preview_height,
@@ -1565,8 +1987,8 @@ class Report:
                     )
                 )
             elif name == "PDF":
-                pdf_button_id = _stable_id("pdf", "button")
-                pdf_download_id = _stable_id("pdf", "download")
+                pdf_button_id = _DASH_PDF_BUTTON_ID
+                pdf_download_id = _DASH_PDF_DOWNLOAD_ID
                 tab_components.append(
                     dcc.Tab(
                         label="PDF",
@@ -1578,12 +2000,17 @@ class Report:
                         ],
                     )
                 )
-        layout_body: list[Any] = []
-        if self.dash_css_text:
-            layout_body.append(html.Style(self.dash_css_text))
-        layout_body.append(html.H1(self.title))
-        if self.author:
-            layout_body.append(html.P(f"Author: {self.author}", className="mf-author"))
+        # Style/title/author header only depends on three strings; reuse it across rebuilds
+        scaffold_key = (self.dash_css_text, self.title, self.author)
+        if self._dash_scaffold is None or self._dash_scaffold[0] != scaffold_key:
+            scaffold: list[Any] = []
+            if self.dash_css_text:
+                scaffold.append(html.Style(self.dash_css_text))
+            scaffold.append(html.H1(self.title))
+            if self.author:
+                scaffold.append(html.P(f"Author: {self.author}", className="mf-author"))
+            self._dash_scaffold = (scaffold_key, tuple(scaffold))
+        layout_body: list[Any] = list(self._dash_scaffold[1])
         if tab_components:
             layout_body.append(dcc.Tabs(id="mf-tabs", value=tab_value, children=tab_components))
         else:
@@ -1603,18 +2030,8 @@ class Report:
                     from dash.exceptions import PreventUpdate  # type: ignore
 
                     raise PreventUpdate
-                import tempfile
-                from pathlib import Path as _Path
-
-                with tempfile.NamedTemporaryFile(suffix=".pdf") as tmp:
-                    self.write_pdf(tmp.name)
-                    data = _Path(tmp.name).read_bytes()
-
-                from dash.dcc import send_bytes  # type: ignore
-
-                def _write_bytes(buffer):
-                    buffer.write(data)
 
-                return send_bytes(_write_bytes, "report.pdf")
+                # ReportLab writes straight into Dash's buffer; no temp file round-trip
+                return dcc.send_bytes(self.write_pdf, "report.pdf")
 
         return app
@@ -3,10 +3,15 @@
 from __future__ import annotations
 
 import io
-from collections.abc import Callable, Sequence
+import os
+import re
+import threading
+from collections.abc import Callable, Iterator, Sequence
 from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, BinaryIO
 
 from reportlab.lib import colors
 from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY, TA_LEFT, TA_RIGHT
@@ -30,6 +35,8 @@ from reportlab.platypus import (
 from reportlab.platypus import Image as RLImage
 from reportlab.platypus import PageBreak as RLPageBreak
 from reportlab.platypus import Table as RLTable
+from reportlab.platypus.paragraph import cleanBlockQuotedText, textTransformFrags
+from reportlab.platypus.paraparser import ParaParser
 
 from .core import (
     DataFrameBlock,
@@ -74,7 +81,11 @@ Alignment = {
     "justify": TA_JUSTIFY,
 }
 
+_FONT_FILE_SUFFIXES = (".ttf", ".otf", ".ttc")
+
 if TYPE_CHECKING:
+    from markdown_it import MarkdownIt
+
     PageLayoutSpec = str | tuple[str, int] | dict[str, Any]
 else:  # pragma: no cover - runtime alias to avoid older interpreter union errors
     PageLayoutSpec = Any
@@ -87,6 +98,46 @@ class _NumberingState:
     equation: int = 0
 
 
+def _frame_size(frame: Frame) -> tuple[float, float]:
+    # Frame stores its geometry as _width/_height; the public names go through
+    # Frame.__getattr__, so only fall back to them for duck-typed frames.
+    try:
+        return float(frame._width), float(frame._height)
+    except AttributeError:
+        return float(frame.width), float(frame.height)
+
+
+# pdfmetrics registrations are process-wide, so the name -> file map is too; a new
+# template reuses an earlier registration instead of re-parsing the TTF under "_1".
+_REGISTERED_FONTS: dict[str, str] = {}
+_FONT_REGISTRY_LOCK = threading.Lock()
+
+
+def _ensure_font_registered(desired_name: str, font_path: Path) -> str:
+    """Register ``font_path`` under ``desired_name`` (or a suffixed variant) once per process."""
+    attempt = 0
+    normalized_path = str(font_path.expanduser())
+    with _FONT_REGISTRY_LOCK:
+        while True:
+            candidate = desired_name if attempt == 0 else f"{desired_name}_{attempt}"
+            existing = _REGISTERED_FONTS.get(candidate)
+            if existing == normalized_path:
+                return candidate
+            if existing is None:
+                try:
+                    pdfmetrics.getFont(candidate)
+                except KeyError:
+                    try:
+                        pdfmetrics.registerFont(TTFont(candidate, normalized_path))
+                    except Exception as exc:
+                        raise RuntimeError(
+                            f"Failed to register font '{candidate}' from {normalized_path}: {exc}"
+                        ) from exc
+                    _REGISTERED_FONTS[candidate] = normalized_path
+                    return candidate
+            attempt += 1
+
+
 @dataclass
 class PDFTemplate:
     """Customization settings for ReportLab PDF output."""
@@ -110,9 +161,12 @@ class PDFTemplate:
     page_layouts: list[PageLayoutSpec] = field(default_factory=list)
     autoscale_images: bool = True
     autoscale_tables: bool = True
+    streaming: bool = False
     font_files: dict[str, str] = field(default_factory=dict)
-    _registered_fonts: dict[str, str] = field(default_factory=dict, init=False, repr=False)
     _font_aliases: dict[str, str] = field(default_factory=dict, init=False, repr=False)
+    _bounds_cache: tuple[tuple[Any, ...], tuple[float, float]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     font: str = "Helvetica"
     font_bold: str = "Helvetica-Bold"
@@ -174,30 +228,6 @@ class PDFTemplate:
             sequence.extend([layout_name] * count_int)
         return sequence
 
-    def _register_font_path(self, desired_name: str, font_path: Path) -> str:
-        attempt = 0
-        normalized_path = str(font_path.expanduser())
-        while True:
-            candidate = desired_name if attempt == 0 else f"{desired_name}_{attempt}"
-            existing = self._registered_fonts.get(candidate)
-            if existing == normalized_path:
-                return candidate
-            if existing is None:
-                try:
-                    pdfmetrics.getFont(candidate)
-                except KeyError:
-                    try:
-                        pdfmetrics.registerFont(TTFont(candidate, normalized_path))
-                    except Exception as exc:
-                        raise RuntimeError(
-                            f"Failed to register font '{candidate}' from {normalized_path}: {exc}"
-                        ) from exc
-                    self._registered_fonts[candidate] = normalized_path
-                    return candidate
-                attempt += 1
-                continue
-            attempt += 1
-
     def _resolve_font(self, font_value: str | None) -> str | None:
         if font_value is None:
             return None
@@ -209,13 +239,15 @@ class PDFTemplate:
         font_name = key
         if key in self.font_files:
             font_path = Path(self.font_files[key])
-        else:
+        elif key.lower().endswith(_FONT_FILE_SUFFIXES):
+            # Only values that look like font files are probed on disk; plain names
+            # such as "Helvetica" return without touching Path or the filesystem
             candidate = Path(key).expanduser()
-            if candidate.suffix.lower() in {".ttf", ".otf", ".ttc"} and candidate.is_file():
+            if candidate.is_file():
                 font_path = candidate
                 font_name = candidate.stem
         if font_path:
-            resolved = self._register_font_path(font_name, font_path)
+            resolved = _ensure_font_registered(font_name, font_path)
             self._font_aliases[key] = resolved
             return resolved
         return font_name
@@ -296,19 +328,37 @@ class PDFTemplate:
 
     def frame_bounds(self) -> tuple[float, float]:
         """Return conservative width/height bounds for the active layout."""
-        layouts: list[str] = []
-        layout_name = (self.layout or "single").lower()
-        layouts.append(layout_name)
-        if self.first_page_layout:
+        # Keyed on every input the frame geometry reads, so assigning a new
+        # margin/layout (or registering a layout builder) invalidates it.
+        key = (
+            self.layout,
+            self.first_page_layout,
+            self.margin_left,
+            self.margin_right,
+            self.margin_top,
+            self.margin_bottom,
+            self.column_gap,
+            self._page_size_tuple(),
+            tuple(self.custom_layouts.items()),
+        )
+        cached = self._bounds_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        bounds = self._compute_frame_bounds()
+        self._bounds_cache = (key, bounds)
+        return bounds
+
+    def _compute_frame_bounds(self) -> tuple[float, float]:
+        layouts = [(self.layout or "single").lower()]
+        if self.first_page_layout and self.first_page_layout.lower() != layouts[0]:
             layouts.append(self.first_page_layout.lower())
         widths: list[float] = []
         heights: list[float] = []
-        for name in dict.fromkeys(layouts):
-            frames = self._frames_for_layout(name)
-            if frames:
-                for frame in frames:
-                    widths.append(float(getattr(frame, "_width", frame.width)))
-                    heights.append(float(getattr(frame, "_height", frame.height)))
+        for name in layouts:
+            for frame in self._frames_for_layout(name) or ():
+                width, height = _frame_size(frame)
+                widths.append(width)
+                heights.append(height)
         if widths and heights:
             return min(widths), min(heights)
         width, height = self._page_size_tuple()
@@ -319,7 +369,7 @@ class PDFTemplate:
 
     def make_document(
         self,
-        output: str,
+        output: str | BinaryIO,
         on_page: Callable[[canvas.Canvas, Any], None] | None = None,
         page_layouts: Sequence[PageLayoutSpec] | None = None,
     ) -> BaseDocTemplate:
@@ -425,20 +475,53 @@ def _paragraph_style(
         or merged.get("textColor")
         or template.text_color
     )
-    style = ParagraphStyle(
-        name=f"style_{id(merged)}",
+    key = (
+        font_name,
+        size,
+        leading,
+        alignment,
+        _color(color_value),
+        merged.get("space_before", 0),
+        merged.get("space_after", 0),
+    )
+    try:
+        return _cached_paragraph_style(*key)
+    except TypeError:  # unhashable override value; build uncached
+        return _build_paragraph_style(*key)
+
+
+def _build_paragraph_style(
+    font_name: str,
+    size: float,
+    leading: float,
+    alignment: int,
+    color: Any,
+    space_before: float,
+    space_after: float,
+) -> ParagraphStyle:
+    return ParagraphStyle(
+        name=f"style_{font_name}_{size}_{leading}_{alignment}",
         fontName=font_name,
         fontSize=size,
         leading=leading,
-        textColor=_color(color_value),
+        textColor=color,
         alignment=alignment,
-        spaceBefore=merged.get("space_before", 0),
-        spaceAfter=merged.get("space_after", 0),
+        spaceBefore=space_before,
+        spaceAfter=space_after,
     )
-    return style
+
+
+# Styles are keyed on fully resolved values, so they can be shared across paragraphs,
+# templates and reports; font re-registration always yields a new font name.
+_cached_paragraph_style = lru_cache(maxsize=512)(_build_paragraph_style)
 
 
 def _escape(text: str) -> str:
+    # Most runs contain nothing to escape; substring probes are far cheaper than
+    # four replace passes (or str.translate, which is slower still for dict tables).
+    # markupsafe's C escape loses too on paragraph-sized runs, and escapes quotes.
+    if "&" not in text and "<" not in text and ">" not in text and "\n" not in text:
+        return text
     text = text.replace("&", "&amp;")
     text = text.replace("<", "&lt;")
     text = text.replace(">", "&gt;")
@@ -446,7 +529,15 @@ def _escape(text: str) -> str:
     return text
 
 
+def _has_inline_markup(text: str) -> bool:
+    # Every inline token starts with one of these. Chained substring tests run as
+    # C-level scans and beat set.isdisjoint/regex on paragraph-length text.
+    return "*" in text or "_" in text or "`" in text or "[" in text or "<" in text
+
+
 def _inline_to_html(text: str, template: PDFTemplate) -> str:
+    if not _has_inline_markup(text):
+        return _escape(text)
     runs = parse_inline(text)
     pieces: list[str] = []
     for run in runs:
@@ -469,12 +560,38 @@ def _inline_to_html(text: str, template: PDFTemplate) -> str:
     return "".join(pieces) if pieces else _escape(text)
 
 
+# Short strings (labels, captions, headings) repeat across a report; longer text
+# rarely does and is not worth pinning in the cache.
+_SHARED_FRAGS_MAX_CHARS = 200
+
+
+@lru_cache(maxsize=1024)
+def _parsed_frags(html: str, style: ParagraphStyle) -> tuple[Any, ...] | None:
+    style_out, frags, bullet_frags = ParaParser().parse(cleanBlockQuotedText(html), style)
+    if frags is None or bullet_frags or style_out is not style:
+        return None
+    textTransformFrags(frags, style)
+    return tuple(frags)
+
+
+def _make_paragraph(html: str, style: ParagraphStyle) -> Paragraph:
+    """Build a Paragraph, reusing the parsed fragments of identical short markup.
+
+    Layout only reads the fragments (and memoises their kind on them), so each
+    Paragraph gets its own list over shared fragment objects.
+    """
+    frags = _parsed_frags(html, style) if len(html) <= _SHARED_FRAGS_MAX_CHARS else None
+    if frags is None:
+        return Paragraph(html, style)
+    return Paragraph(html, style, frags=list(frags))
+
+
 def _paragraph(
     text: str, template: PDFTemplate, overrides: dict[str, Any] | None = None
 ) -> Paragraph:
     style = _paragraph_style(template, overrides=overrides)
     html = _inline_to_html(text, template)
-    return Paragraph(html, style)
+    return _make_paragraph(html, style)
 
 
 def _heading(
@@ -493,7 +610,7 @@ def _heading(
         base_font=template.font_bold,
         font_size=font_size,
     )
-    return Paragraph(_inline_to_html(text, template), style)
+    return _make_paragraph(_inline_to_html(text, template), style)
 
 
 def _table(block: CoreTable, template: PDFTemplate) -> Flowable:
@@ -509,35 +626,23 @@ def _table(block: CoreTable, template: PDFTemplate) -> Flowable:
     body_font = (
         template._resolve_font(style_opts.get("body_font") or template.font) or template.font
     )
-    base_style = [
-        (
-            "BACKGROUND",
-            (0, 0),
-            (-1, 0),
-            _color(style_opts.get("header_bg", template.table_header_bg)),
-        ),
-        (
-            "TEXTCOLOR",
-            (0, 0),
-            (-1, 0),
-            _color(style_opts.get("header_text", template.table_header_text)),
-        ),
-        ("FONTNAME", (0, 0), (-1, 0), header_font),
-        ("FONTNAME", (0, 1), (-1, -1), body_font),
-        ("FONTSIZE", (0, 0), (-1, -1), style_opts.get("font_size", template.base_font_size)),
-        ("ALIGN", (0, 0), (-1, -1), style_opts.get("align", "LEFT")),
-        ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-        (
-            "GRID",
-            (0, 0),
-            (-1, -1),
-            style_opts.get("grid_width", 0.25),
-            _color(style_opts.get("grid_color", colors.grey)),
-        ),
-    ]
+    key = (
+        _color(style_opts.get("header_bg", template.table_header_bg)),
+        _color(style_opts.get("header_text", template.table_header_text)),
+        header_font,
+        body_font,
+        style_opts.get("font_size", template.base_font_size),
+        style_opts.get("align", "LEFT"),
+        style_opts.get("grid_width", 0.25),
+        _color(style_opts.get("grid_color", colors.grey)),
+    )
+    try:
+        table.setStyle(_cached_table_style(*key))
+    except TypeError:  # unhashable override value; build uncached
+        table.setStyle(_build_table_style(*key))
     if "style" in style_opts:
-        base_style.extend(style_opts["style"])
-    table.setStyle(TableStyle(base_style))
+        # Applied after the base commands, exactly as if appended to them
+        table.setStyle(TableStyle(style_opts["style"]))
     if template.autoscale_tables:
         max_w, max_h = template.frame_bounds()
         scaled = _shrink_flowable(table, max_w, max_h)
@@ -546,9 +651,44 @@ def _table(block: CoreTable, template: PDFTemplate) -> Flowable:
     return table
 
 
+def _build_table_style(
+    header_bg: Any,
+    header_text: Any,
+    header_font: str,
+    body_font: str,
+    font_size: float,
+    align: str,
+    grid_width: float,
+    grid_color: Any,
+) -> TableStyle:
+    return TableStyle(
+        [
+            ("BACKGROUND", (0, 0), (-1, 0), header_bg),
+            ("TEXTCOLOR", (0, 0), (-1, 0), header_text),
+            ("FONTNAME", (0, 0), (-1, 0), header_font),
+            ("FONTNAME", (0, 1), (-1, -1), body_font),
+            ("FONTSIZE", (0, 0), (-1, -1), font_size),
+            ("ALIGN", (0, 0), (-1, -1), align),
+            ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+            ("GRID", (0, 0), (-1, -1), grid_width, grid_color),
+        ]
+    )
+
+
+# setStyle() only reads the commands, so one TableStyle serves every table that
+# resolves to the same base settings.
+_cached_table_style = lru_cache(maxsize=256)(_build_table_style)
+
+
 _SHRINK_NEAR_UNIT = 0.999
 
 
+@lru_cache(maxsize=1)
+def _measure_canvas() -> canvas.Canvas:
+    """Throwaway canvas handed to wrapOn() for measuring; never saved, so one suffices."""
+    return canvas.Canvas(io.BytesIO())
+
+
 def _shrink_flowable(
     flow: Flowable, max_width: float | None, max_height: float | None, *, min_scale: float = 0.4
 ) -> Flowable:
@@ -556,8 +696,9 @@ def _shrink_flowable(
     usable_h = float(max_height) if max_height and max_height > 0 else None
     if not usable_w and not usable_h:
         return flow
-    fake = canvas.Canvas(io.BytesIO())
-    width, height = flow.wrapOn(fake, usable_w or 10_000, usable_h or 10_000)
+    # wrapOn (not wrap) even for tables: cells may hold flowables that measure
+    # against ``self.canv``, and with the shared canvas the extra cost is nil.
+    width, height = flow.wrapOn(_measure_canvas(), usable_w or 10_000, usable_h or 10_000)
     need_width = usable_w is not None and width > usable_w + 0.5
     need_height = usable_h is not None and height > usable_h + 0.5
     if not (need_width or need_height):
@@ -572,30 +713,57 @@ def _shrink_flowable(
     return _ScaledFlowable(flow, scale)
 
 
+_DIMENSION_RE = re.compile(r"\s*([+-]?(?:\d+\.?\d*|\.\d+)(?:e[+-]?\d+)?)\s*(px|%)\s*", re.I)
+
+
 def _parse_dimension(value: Any, template: PDFTemplate, axis: str) -> float | None:
     """Convert user-provided dimensions to absolute point values."""
-    result: float | None = None
     if value is None:
-        return result
+        return None
     if isinstance(value, int | float):
-        result = float(value)
-    elif isinstance(value, str):
-        cleaned = value.strip().lower()
-        if cleaned.endswith("px"):
-            try:
-                result = float(cleaned[:-2])
-            except ValueError:
-                result = None
-        elif cleaned.endswith("%"):
-            try:
-                pct = float(cleaned[:-1]) / 100.0
-            except ValueError:
-                pct = None
-            if pct is not None:
-                max_w, max_h = template.frame_bounds()
-                base = max_w if axis == "width" else max_h
-                result = base * pct
-    return result
+        return float(value)
+    if not isinstance(value, str):
+        return None
+    match = _DIMENSION_RE.fullmatch(value)
+    if match is None:
+        return None
+    number, unit = match.groups()
+    if unit == "%":
+        max_w, max_h = template.frame_bounds()
+        base = max_w if axis == "width" else max_h
+        return base * float(number) / 100.0
+    return float(number)
+
+
+def _image_dims(path: str) -> tuple[float, float]:
+    """Return an image's pixel size, decoding each file's header once per (mtime, size)."""
+    try:
+        st = os.stat(path)
+    except (OSError, TypeError, ValueError):
+        # Not a plain file path (stream, URL, missing file); let ImageReader decide
+        return ImageReader(path).getSize()
+    return _cached_image_dims(str(path), st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=512)
+def _cached_image_dims(path: str, mtime_ns: int, size: int) -> tuple[float, float]:
+    return ImageReader(path).getSize()
+
+
+def _image_reader(path: str) -> ImageReader:
+    """Return a shared ImageReader for ``path`` (decoded pixel data is cached on the reader)."""
+    try:
+        st = os.stat(path)
+    except (OSError, TypeError, ValueError):
+        return ImageReader(path)
+    return _pooled_image_reader(str(path), st.st_mtime_ns, st.st_size)
+
+
+# Readers hold decoded bitmaps once drawn, so keep the pool small; report_to_pdf
+# empties it after every build
+@lru_cache(maxsize=32)
+def _pooled_image_reader(path: str, mtime_ns: int, size: int) -> ImageReader:
+    return ImageReader(path)
 
 
 def _image_size_from_hints(
@@ -606,8 +774,7 @@ def _image_size_from_hints(
     height_hint: Any = None,
     frame_bounds: tuple[float, float] | None = None,
 ) -> tuple[float, float]:
-    reader = ImageReader(path)
-    orig_w, orig_h = reader.getSize()
+    orig_w, orig_h = _image_dims(path)
     orig_w = max(float(orig_w), 1.0)
     orig_h = max(float(orig_h), 1.0)
     width = _parse_dimension(width_hint, template, axis="width")
@@ -686,14 +853,14 @@ class _AbsoluteImageFlowable(Flowable):
     def __init__(self, directive: AbsoluteImageDirective):
         super().__init__()
         self.directive = directive
-        self._reader = ImageReader(directive.path)
+        self._size = _image_dims(directive.path)
 
     def wrap(self, *_) -> tuple[float, float]:  # pragma: no cover - positional flowable
         return (0, 0)
 
     def draw(self) -> None:  # pragma: no cover - ReportLab callback
         canv = self.canv
-        width, height = self._reader.getSize()
+        width, height = self._size
         dw = self.directive.width or width
         dh = self.directive.height or height
         canv.saveState()
@@ -744,18 +911,31 @@ class _ScalingImage(RLImage):
         super().__init__(filename, **kwargs)
         self._max_width = max_width
         self._max_height = max_height
+        # Clamp to the frame bounds once; wrap() then only has to react to a
+        # narrower column than the one the image was sized for.
+        self._restrictSize(
+            max_width if max_width and max_width > 0 else self.drawWidth,
+            self._target_height(),
+        )
+
+    def _target_height(self) -> float:
+        if self._max_height is None or self._max_height <= 0:
+            return self.drawHeight
+        return self._max_height
+
+    def __getattr__(self, a: str) -> Any:
+        # RLImage opens its reader lazily on first `_img` access; JPEGs set `_img = None`
+        # up front (embedded directly) and never get here. Share pooled readers so
+        # repeated images reuse one decoded bitmap.
+        if a == "_img" and isinstance(self.__dict__.get("_file"), str):
+            self._img = _image_reader(self._file)
+            return self._img
+        return super().__getattr__(a)
 
     def wrap(self, availWidth: float, availHeight: float):
-        target_width = self._max_width
-        if target_width is None or target_width <= 0:
-            target_width = self.drawWidth
-        if availWidth and availWidth > 0:
-            target_width = min(target_width, availWidth) if target_width else availWidth
-        target_height = self._max_height
-        if target_height is None or target_height <= 0:
-            target_height = self.drawHeight
-        self._restrictSize(target_width, target_height)
-        return super().wrap(availWidth, availHeight)
+        if availWidth and 0 < availWidth < self.drawWidth:
+            self._restrictSize(availWidth, self._target_height())
+        return self.drawWidth, self.drawHeight
 
 
 class _ScaledFlowable(Flowable):
@@ -764,13 +944,20 @@ class _ScaledFlowable(Flowable):
         self.inner = inner
         self.scale = float(scale)
         self._wrapped: tuple[float, float] = (0.0, 0.0)
+        self._wrap_key: tuple[float, float] | None = None
 
     def wrap(self, availWidth: float, availHeight: float) -> tuple[float, float]:
+        # Frame retries re-wrap with the same space; only the latest result is
+        # reused so the inner flowable's layout state always matches what we return.
+        key = (availWidth, availHeight)
+        if key == self._wrap_key:
+            return self._wrapped
         scale = self.scale if self.scale > 0 else 1.0
         target_width = availWidth / scale if scale else availWidth
         target_height = availHeight / scale if scale else availHeight
         width, height = self.inner.wrap(target_width, target_height)
         self._wrapped = (width * scale, height * scale)
+        self._wrap_key = key
         return self._wrapped
 
     def draw(self) -> None:
@@ -951,8 +1138,9 @@ def _render_dataframe(block: DataFrameBlock, template: PDFTemplate) -> list[Any]
         import pandas as pd  # type: ignore
 
         df = block.data if hasattr(block.data, "columns") else pd.DataFrame(block.data)
-        headers = list(df.columns)
-        rows = df.values.tolist()
+        headers = list(map(str, df.columns))
+        # Stringify once in pandas rather than per cell inside every RLTable wrap
+        rows = df.astype(str).to_numpy(dtype=object).tolist()
         tbl = _table(CoreTable(headers=headers, rows=rows), template)
         flows: list[Any] = [tbl]
         if block.caption:
@@ -971,53 +1159,18 @@ def _block_flowables(
     numbering: _NumberingState,
     labels: dict[str, str],
 ) -> list[Any]:
-    flows: list[Any] = []
-    if isinstance(block, str):
-        flows.append(_paragraph(block, template))
-    elif isinstance(block, CoreTable):
-        flows.append(_table(block, template))
-    elif isinstance(block, CoreImage):
-        flows.extend(_image(block, template))
-    elif isinstance(block, FigureBlock):
-        flows.extend(_figure_flowables(block, template, numbering, labels))
-    elif isinstance(block, TableBlock):
-        flows.extend(_table_with_caption(block, template, numbering, labels))
-    elif isinstance(block, InteractiveFigure):
-        flows.extend(_figure_flowables(block.figure, template, numbering, labels))
-    elif isinstance(block, CorePageBreak):
-        flows.append(RLPageBreak())
-    elif isinstance(block, DataFrameBlock):
-        flows.extend(_render_dataframe(block, template))
-    elif isinstance(block, Section):
-        flows.extend(_render_section(block, template, numbering, labels))
-    elif isinstance(block, LayoutBlock):
-        flows.extend(_layout_block_flowables(block, template, numbering, labels))
-    elif isinstance(block, FlowableDirective):
-        produced = block.factory(template)
-        if produced is not None:
-            if isinstance(produced, list | tuple):
-                for item in produced:
-                    if item is not None:
-                        flows.append(item)
-            else:
-                flows.append(produced)
-    elif isinstance(block, TwoColumnDirective):
-        flows.extend(_two_column_flowables(block, template, numbering, labels))
-    elif isinstance(block, AbsoluteImageDirective):
-        flows.append(_AbsoluteImageFlowable(block))
-    elif isinstance(block, FloatingImageDirective):
-        flows.extend(_floating_image(block, template))
-    elif isinstance(block, VerticalSpaceDirective):
-        flows.append(Spacer(1, block.height))
-    elif isinstance(block, DoubleSpaceDirective):
-        if block.active:
-            flows.append(Spacer(1, template.base_font_size * template.line_spacing))
-    elif hasattr(block, "to_markdown"):
+    typ = type(block)
+    handler = _PDF_BLOCK_RENDERERS.get(typ)
+    if handler is None and typ not in _PDF_UNHANDLED_TYPES:
+        handler = _pdf_renderer_for(typ)
+    if handler is not None:
+        return handler(block, template, numbering, labels)
+    if hasattr(block, "to_markdown"):
         try:
-            flows.append(_paragraph(block.to_markdown(), template))
+            return [_paragraph(block.to_markdown(), template)]
         except Exception:
-            flows.append(_paragraph(str(block), template))
-    return flows
+            return [_paragraph(str(block), template)]
+    return []
 
 
 def _render_section(
@@ -1026,79 +1179,302 @@ def _render_section(
     numbering: _NumberingState,
     labels: dict[str, str],
 ) -> list[Any]:
-    flowables: list[Any] = []
-    flowables.append(_heading(section.title, section.level, template, section.pdf_style))
-    flowables.append(Spacer(1, template.base_font_size * template.section_spacing))
+    gap = template.base_font_size * template.section_spacing
+    flowables: list[Any] = [
+        _heading(section.title, section.level, template, section.pdf_style),
+        Spacer(1, gap),
+    ]
     for blk in section.blocks:
         flowables.extend(_block_flowables(blk, template, numbering, labels))
-        flowables.append(Spacer(1, template.base_font_size * template.section_spacing))
+        last = flowables[-1]
+        if isinstance(blk, Section) and type(last) is Spacer:
+            # A nested section ends with the gap spacer emitted here; one taller
+            # spacer lays out the same as two stacked ones. User flowables
+            # (vertical-space and flowable directives) are never merged.
+            flowables[-1] = Spacer(last.width, last.height + gap)
+        else:
+            flowables.append(Spacer(1, gap))
     return flowables
 
 
+# ----- per-type PDF renderers (_block_flowables dispatch) -----
+
+_PdfHandler = Callable[[Any, PDFTemplate, _NumberingState, dict[str, str]], list[Any]]
+
+
+def _pdf_text(
+    block: str, template: PDFTemplate, numbering: _NumberingState, labels: dict[str, str]
+) -> list[Any]:
+    return [_paragraph(block, template)]
+
+
+def _pdf_table(
+    block: CoreTable, template: PDFTemplate, numbering: _NumberingState, labels: dict[str, str]
+) -> list[Any]:
+    return [_table(block, template)]
+
+
+def _pdf_image(
+    block: CoreImage, template: PDFTemplate, numbering: _NumberingState, labels: dict[str, str]
+) -> list[Any]:
+    return _image(block, template)
+
+
+def _pdf_interactive(
+    block: InteractiveFigure,
+    template: PDFTemplate,
+    numbering: _NumberingState,
+    labels: dict[str, str],
+) -> list[Any]:
+    return _figure_flowables(block.figure, template, numbering, labels)
+
+
+def _pdf_page_break(
+    block: CorePageBreak, template: PDFTemplate, numbering: _NumberingState, labels: dict[str, str]
+) -> list[Any]:
+    return [RLPageBreak()]
+
+
+def _pdf_dataframe(
+    block: DataFrameBlock, template: PDFTemplate, numbering: _NumberingState, labels: dict[str, str]
+) -> list[Any]:
+    return _render_dataframe(block, template)
+
+
+def _pdf_flowable_directive(
+    block: FlowableDirective,
+    template: PDFTemplate,
+    numbering: _NumberingState,
+    labels: dict[str, str],
+) -> list[Any]:
+    produced = block.factory(template)
+    if produced is None:
+        return []
+    if isinstance(produced, list | tuple):
+        return [item for item in produced if item is not None]
+    return [produced]
+
+
+def _pdf_absolute_image(
+    block: AbsoluteImageDirective,
+    template: PDFTemplate,
+    numbering: _NumberingState,
+    labels: dict[str, str],
+) -> list[Any]:
+    return [_AbsoluteImageFlowable(block)]
+
+
+def _pdf_floating_image(
+    block: FloatingImageDirective,
+    template: PDFTemplate,
+    numbering: _NumberingState,
+    labels: dict[str, str],
+) -> list[Any]:
+    return _floating_image(block, template)
+
+
+def _pdf_vertical_space(
+    block: VerticalSpaceDirective,
+    template: PDFTemplate,
+    numbering: _NumberingState,
+    labels: dict[str, str],
+) -> list[Any]:
+    return [Spacer(1, block.height)]
+
+
+def _pdf_double_space(
+    block: DoubleSpaceDirective,
+    template: PDFTemplate,
+    numbering: _NumberingState,
+    labels: dict[str, str],
+) -> list[Any]:
+    if not block.active:
+        return []
+    return [Spacer(1, template.base_font_size * template.line_spacing)]
+
+
+# Keyed by exact type; subclasses resolve through _pdf_renderer_for
+_PDF_BLOCK_RENDERERS: dict[type, _PdfHandler] = {
+    str: _pdf_text,
+    CoreTable: _pdf_table,
+    CoreImage: _pdf_image,
+    FigureBlock: _figure_flowables,
+    TableBlock: _table_with_caption,
+    InteractiveFigure: _pdf_interactive,
+    CorePageBreak: _pdf_page_break,
+    DataFrameBlock: _pdf_dataframe,
+    Section: _render_section,
+    LayoutBlock: _layout_block_flowables,
+    FlowableDirective: _pdf_flowable_directive,
+    TwoColumnDirective: _two_column_flowables,
+    AbsoluteImageDirective: _pdf_absolute_image,
+    FloatingImageDirective: _pdf_floating_image,
+    VerticalSpaceDirective: _pdf_vertical_space,
+    DoubleSpaceDirective: _pdf_double_space,
+}
+
+
+# Custom block types with no renderer (to_markdown() fallback only), so their MRO
+# is walked once rather than for every instance
+_PDF_UNHANDLED_TYPES: set[type] = set()
+
+
+def _pdf_renderer_for(typ: type) -> _PdfHandler | None:
+    """Resolve (and remember) a renderer for subclasses of the built-in block types."""
+    for base in typ.__mro__[1:]:
+        handler = _PDF_BLOCK_RENDERERS.get(base)
+        if handler is not None:
+            _PDF_BLOCK_RENDERERS[typ] = handler
+            return handler
+    _PDF_UNHANDLED_TYPES.add(typ)
+    return None
+
+
+class _StreamingStory(list):
+    """Story list that pulls section batches lazily while ``doc.build`` consumes it.
+
+    ``BaseDocTemplate.build`` deletes flowables from the front as they are laid
+    out and re-checks ``len()`` each step, so topping the list up there keeps only
+    a small window (enough for keep-with-next lookahead) of flowables alive.
+    """
+
+    def __init__(self, batches: Iterator[list[Any]], lookahead: int = 32):
+        super().__init__()
+        self._batches: Iterator[list[Any]] | None = batches
+        self._lookahead = lookahead
+
+    def __len__(self) -> int:
+        while self._batches is not None and list.__len__(self) < self._lookahead:
+            batch = next(self._batches, None)
+            if batch is None:
+                self._batches = None
+            else:
+                self.extend(batch)
+        return list.__len__(self)
+
+
+def _story_batches(rpt: Report, template: PDFTemplate) -> Iterator[list[Any]]:
+    numbering = _NumberingState()
+    labels: dict[str, str] = {}
+    front: list[Any] = [_heading(rpt.title, 1, template, rpt.pdf_style)]
+    if rpt.author:
+        front.append(_paragraph(f"Author: {rpt.author}", template))
+    if rpt.date_str:
+        front.append(_paragraph(rpt.date_str, template))
+    front.append(Spacer(1, template.base_font_size * template.section_spacing))
+    yield front
+    for section in rpt.sections:
+        yield _render_section(section, template, numbering, labels)
+
+
 def _default_footer(canvas_obj: canvas.Canvas, template: PDFTemplate, page_num: int) -> None:
+    width, _ = template.page_size
+    _draw_page_number(
+        canvas_obj,
+        width / 2,
+        template.margin_bottom / 2,
+        template.font,
+        max(template.base_font_size - 1, 8),
+        page_num,
+    )
+
+
+def _draw_page_number(
+    canvas_obj: canvas.Canvas, x: float, y: float, font: str, size: float, page_num: int
+) -> None:
     canvas_obj.saveState()
-    canvas_obj.setFont(template.font, max(template.base_font_size - 1, 8))
+    canvas_obj.setFont(font, size)
     canvas_obj.setFillColor(colors.grey)
-    width, _ = template.page_size
-    canvas_obj.drawCentredString(width / 2, template.margin_bottom / 2, f"Page {page_num}")
+    canvas_obj.drawCentredString(x, y, f"Page {page_num}")
     canvas_obj.restoreState()
 
 
 def _on_page(template: PDFTemplate) -> Callable[[canvas.Canvas, Any], None]:
+    header_fn = template.header_fn
+    footer_fn = template.footer_fn
+    if footer_fn is _default_footer:
+        # The default footer's geometry is fixed for a build; resolve it once, not per page
+        width, _ = template.page_size
+        x, y = width / 2, template.margin_bottom / 2
+        font, size = template.font, max(template.base_font_size - 1, 8)
+
+        def footer_fn(canv: canvas.Canvas, _template: PDFTemplate, page_num: int) -> None:
+            _draw_page_number(canv, x, y, font, size, page_num)
+
     def wrapper(canv: canvas.Canvas, doc: Any) -> None:
         page_num = canv.getPageNumber()
-        if template.header_fn:
-            template.header_fn(canv, template, page_num)
-        if template.footer_fn:
-            template.footer_fn(canv, template, page_num)
+        if header_fn:
+            header_fn(canv, template, page_num)
+        if footer_fn:
+            footer_fn(canv, template, page_num)
 
     return wrapper
 
 
-def report_to_pdf(rpt: Report, out_pdf_path: str, template: PDFTemplate | None = None) -> str:
-    """Render a Report instance to a PDF file and return the path."""
+def report_to_pdf(
+    rpt: Report, out_pdf_path: str | BinaryIO, template: PDFTemplate | None = None
+) -> str | BinaryIO:
+    """Render a Report instance to a PDF file (or binary stream) and return the target."""
     template = template or PDFTemplate()
     template._prepare_fonts()
     if template.footer_fn is None:
         template.footer_fn = _default_footer
-    numbering = _NumberingState()
-    labels: dict[str, str] = {}
     on_page = _on_page(template)
     doc = template.make_document(out_pdf_path, on_page)
-    story: list[Any] = []
-    story.append(_heading(rpt.title, 1, template, rpt.pdf_style))
-    if rpt.author:
-        story.append(_paragraph(f"Author: {rpt.author}", template))
-    if rpt.date_str:
-        story.append(_paragraph(rpt.date_str, template))
-    story.append(Spacer(1, template.base_font_size * template.section_spacing))
-    for section in rpt.sections:
-        story.extend(_render_section(section, template, numbering, labels))
-    doc.build(story)
+    batches = _story_batches(rpt, template)
+    try:
+        if template.streaming:
+            # Sections are rendered on demand, so peak memory follows one section
+            # rather than the whole story.
+            doc.build(_StreamingStory(batches))
+        else:
+            doc.build(list(chain.from_iterable(batches)))
+    finally:
+        # Pooled readers hold decoded bitmaps; share them within a build only
+        _pooled_image_reader.cache_clear()
     return out_pdf_path
 
 
 # ---- Minimal HTML/PDF helpers (public API) ----
 
 
+@lru_cache(maxsize=1)
+def _markdown_parser() -> MarkdownIt:
+    """Shared parser; configuring one costs more than rendering a short document."""
+    from markdown_it import MarkdownIt
+
+    return MarkdownIt("commonmark").enable("table").enable("strikethrough").enable("linkify")
+
+
+def markdown_to_html_fragment(md_text: str) -> str:
+    """Convert Markdown text into an HTML body fragment (no document wrapper)."""
+    # render() builds fresh parse state per call, so one instance is safe to share
+    return _markdown_parser().render(md_text)
+
+
+_DEFAULT_HTML_CSS = (
+    "@page { size: Letter; margin: 18mm 16mm 22mm 16mm; }\n"
+    ":root { --text: #1f2328; --muted: #6a737d; }\n"
+    "body { font-family: system-ui, -apple-system, Segoe UI, Roboto, Ubuntu, Cantarell, 'Noto Sans', sans-serif; color: var(--text); line-height: 1.5; }\n"
+    "h1,h2,h3,h4 { page-break-after: avoid; }\n"
+    "pre, code { font-family: ui-monospace, SFMono-Regular, Menlo, Consolas, 'Liberation Mono', monospace; }\n"
+    "figure { margin: 0; text-align: center; }\n"
+    "figcaption { color: var(--muted); font-size: 0.9em; margin-top: 4px; }\n"
+    "table { width: 100%; border-collapse: collapse; }\n"
+    "th, td { border: 1px solid #ccc; padding: 4px 8px; }\n"
+)
+
+
 def markdown_to_html(md_text: str, title: str = "Report", extra_css: str | None = None) -> str:
     """Convert Markdown text into a styled standalone HTML string."""
-    from markdown_it import MarkdownIt
+    return _cached_markdown_to_html(md_text, title, extra_css)
 
-    DEFAULT_CSS = (
-        "@page { size: Letter; margin: 18mm 16mm 22mm 16mm; }\n"
-        ":root { --text: #1f2328; --muted: #6a737d; }\n"
-        "body { font-family: system-ui, -apple-system, Segoe UI, Roboto, Ubuntu, Cantarell, 'Noto Sans', sans-serif; color: var(--text); line-height: 1.5; }\n"
-        "h1,h2,h3,h4 { page-break-after: avoid; }\n"
-        "pre, code { font-family: ui-monospace, SFMono-Regular, Menlo, Consolas, 'Liberation Mono', monospace; }\n"
-        "figure { margin: 0; text-align: center; }\n"
-        "figcaption { color: var(--muted); font-size: 0.9em; margin-top: 4px; }\n"
-        "table { width: 100%; border-collapse: collapse; }\n"
-        "th, td { border: 1px solid #ccc; padding: 4px 8px; }\n"
-    )
-    md = MarkdownIt("commonmark").enable("table").enable("strikethrough").enable("linkify")
-    body = md.render(md_text)
-    css = DEFAULT_CSS + ("\n" + extra_css if extra_css else "")
+
+# Interactive apps re-render on every callback, usually with unchanged text
+@lru_cache(maxsize=64)
+def _cached_markdown_to_html(md_text: str, title: str, extra_css: str | None) -> str:
+    body = markdown_to_html_fragment(md_text)
+    css = _DEFAULT_HTML_CSS + ("\n" + extra_css if extra_css else "")
     return (
         f'<!doctype html>\n<html>\n<head>\n<meta charset="utf-8">\n<title>{title}</title>\n'
         f"<style>{css}</style>\n</head>\n<body>\n{body}\n</body>\n</html>"
@@ -18,6 +18,7 @@ import io
 import pathlib
 import re
 import sys
+from functools import lru_cache
 from typing import Optional
 
 from dash import Dash, dcc, html, Input, Output, State
@@ -32,15 +33,29 @@ from easypour import markdown_to_html
 
 
 def _make_plot_png_bytes(m: float) -> Optional[bytes]:
+    # The slider moves in 0.05 steps; rounding keeps float noise from missing the cache
+    return _plot_png_bytes(round(m, 2))
+
+
+@lru_cache(maxsize=1)
+def _scatter_data():
+    import numpy as np  # type: ignore
+
+    rng = np.random.default_rng(0)
+    x = rng.normal(0, 1.0, size=160)
+    y = 0.8 * x + rng.normal(0, 0.35, size=160)
+    return x, y
+
+
+@lru_cache(maxsize=64)
+def _plot_png_bytes(m: float) -> Optional[bytes]:
     try:
         import numpy as np  # type: ignore
         import matplotlib.pyplot as plt  # type: ignore
     except Exception:
         return None
 
-    rng = np.random.default_rng(0)
-    x = rng.normal(0, 1.0, size=160)
-    y = 0.8 * x + rng.normal(0, 0.35, size=160)
+    x, y = _scatter_data()
 
     fig, ax = plt.subplots(figsize=(3.6, 2.4))
     ax.scatter(x, y, s=12, alpha=0.85, label="data")
@@ -57,13 +72,25 @@ def _make_plot_png_bytes(m: float) -> Optional[bytes]:
     return buf.getvalue()
 
 
+_IMG_SRC_RE = re.compile(r'src="[^"]+"')
+
+
+@lru_cache(maxsize=8)
+def _png_data_uri(img_bytes: bytes) -> str:
+    # Toggling the table checkbox re-renders with the same plot bytes
+    return "data:image/png;base64," + base64.b64encode(img_bytes).decode("ascii")
+
+
 def _html_inline_images(html_doc: str, img_bytes: Optional[bytes]) -> str:
     if not img_bytes:
         return html_doc
     # Replace the first <img ...> with a data URI (simple heuristic)
-    b64 = base64.b64encode(img_bytes).decode("ascii")
-    data_uri = f"data:image/png;base64,{b64}"
-    return re.sub(r'src="([^"]+)"', f'src="{data_uri}"', html_doc, count=1)
+    match = _IMG_SRC_RE.search(html_doc)
+    if match is None:
+        return html_doc
+    data_uri = _png_data_uri(img_bytes)
+    # Splice rather than re.sub: sub would scan the whole data URI as a template
+    return f'{html_doc[: match.start()]}src="{data_uri}"{html_doc[match.end() :]}'
 
 
 def build_report(include_table: bool, include_plot: bool, m: float) -> tuple[Report, Optional[bytes]]:
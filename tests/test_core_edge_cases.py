@@ -56,3 +56,106 @@ def test_write_markdown_returns_absolute_path(tmp_path):
     abs_path = rpt.write_markdown(str(out))
     assert os.path.isabs(abs_path)
     assert os.path.samefile(abs_path, out)
+
+
+def test_table_from_dicts_fills_missing_keys():
+    t = Table.from_dicts([{"a": 1, "b": 2}, {"b": 3}, {"a": 4, "b": 5, "extra": 6}])
+    assert t.headers == ["a", "b"]
+    assert t.rows == [[1, 2], ["", 3], [4, 5]]
+    single = Table.from_dicts([{"a": 1}, {}])
+    assert single.rows == [[1], [""]]
+
+
+def test_asset_manager_modes_place_identical_bytes(tmp_path, tmp_png):
+    from easypour.core import AssetManager
+
+    for mode in ("auto", "link", "copy"):
+        am = AssetManager(base=tmp_path / mode, mode=mode)
+        dst = am.put(tmp_png)
+        assert dst.read_bytes() == tmp_png.read_bytes()
+        # Re-ingesting the same asset is a no-op rather than an error
+        assert am.put(tmp_png) == dst
+        assert dst == am.base / tmp_png.name
+    linked = AssetManager(base=tmp_path / "link2", mode="link").put(tmp_png)
+    assert linked.samefile(tmp_png)
+    # The default copies, so the managed asset never aliases its source
+    copied = AssetManager(base=tmp_path / "default").put(tmp_png)
+    assert not copied.samefile(tmp_png)
+    copied.write_bytes(b"changed")
+    assert tmp_png.read_bytes() != b"changed"
+
+
+def test_asset_manager_explicit_modes_raise_instead_of_leaving_empty_files(tmp_path, tmp_png):
+    import pytest
+
+    from easypour.core import AssetManager
+
+    am = AssetManager(base=tmp_path / "reflink", mode="reflink")
+    try:
+        dst = am.put(tmp_png)
+    except OSError:
+        # Filesystem without FICLONE support (e.g. ext4/tmpfs): nothing is left behind
+        assert not (am.base / tmp_png.name).exists()
+    else:
+        assert dst.read_bytes() == tmp_png.read_bytes()
+    with pytest.raises(OSError):
+        AssetManager(base=tmp_path / "link", mode="link").put(tmp_path / "missing.png")
+    # auto still falls back to a full copy
+    auto = AssetManager(base=tmp_path / "auto", mode="auto").put(tmp_png)
+    assert auto.read_bytes() == tmp_png.read_bytes()
+
+
+def test_dataframe_block_output_does_not_depend_on_frame_size():
+    import pytest
+
+    pd = pytest.importorskip("pandas")
+    pytest.importorskip("tabulate")
+    from easypour.core import DataFrameBlock
+
+    for n in (500, 501, 2000):
+        df = pd.DataFrame({"id": range(n), "name": [f"r|{i}" for i in range(n)], "x": [0.5] * n})
+        md = DataFrameBlock(df, caption="Big").to_markdown()
+        assert md == df.to_markdown(index=False) + "\n\n*Big*"
+
+
+def test_asset_base_rewrites_paths_without_mutating_images(tmp_path, tmp_png):
+    rpt = Report("R")
+    img = Image(str(tmp_png), alt="x")
+    rpt.add_section("S").blocks.append(img)
+    md = rpt.to_markdown(asset_base=tmp_path / "assets")
+    assert f"![x]({tmp_path / 'assets' / tmp_png.name})" in md
+    assert img.path == str(tmp_png)
+    # The relocated render must not leak into a plain render through the section cache
+    assert f"![x]({tmp_png})" in rpt.to_markdown()
+
+
+def test_streamlit_theme_css_is_cached_and_tracks_direct_edits():
+    rpt = Report("Theme")
+    assert rpt._streamlit_css() == ""
+    rpt.set_streamlit_theme(link_color="blue", css="h1 { margin: 0; }")
+    assert rpt._streamlit_css() == "a, a:visited { color: blue; }\nh1 { margin: 0; }"
+    rpt.streamlit_theme["text_color"] = "black"
+    assert rpt._streamlit_css().startswith("body { color: black; }\n")
+
+
+def test_asset_manager_put_many_ingests_each_source_once(tmp_path, tmp_png, monkeypatch):
+    from pathlib import Path
+
+    from easypour.core import AssetManager
+
+    monkeypatch.chdir(tmp_path)
+    am = AssetManager(base=Path("many"), mode="copy")
+    placed = am.put_many([tmp_png, str(tmp_png), tmp_path / "missing.png"])
+    # Returned paths keep the shape of ``base`` (relative here), not a resolved one
+    assert placed[str(tmp_png)] == Path("many") / tmp_png.name
+    assert placed[str(tmp_png)].read_bytes() == tmp_png.read_bytes()
+    assert not placed[str(tmp_path / "missing.png")].exists()
+
+
+def test_html_export_is_reused_until_markdown_changes():
+    rpt = Report("HTML")
+    sec = rpt.add_section("S")
+    first = rpt._html_for(rpt.to_markdown())
+    assert rpt._html_for(rpt.to_markdown()) is first
+    sec.add_text("more")
+    assert "more" in rpt._html_for(rpt.to_markdown())
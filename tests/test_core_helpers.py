@@ -28,3 +28,37 @@ def test_code_inline():
 
 def test_link():
     assert url("site", "https://ex.com") == "[site](https://ex.com)"
+
+
+def test_slug_ascii_and_unicode_titles():
+    assert core._slug("Hello, World!") == "hello-world"
+    assert core._slug("  --a__B--  ") == "a-b"
+    assert core._slug("Café Über") == "cafe-uber"
+    assert core._slug("!!!") == "section"
+
+
+def test_data_uri_is_keyed_on_file_state(tmp_path):
+    import base64
+    import os
+
+    img = tmp_path / "a.png"
+    img.write_bytes(b"one")
+    st = os.stat(img)
+    uri = core._data_uri(str(img), st.st_mtime_ns, st.st_size)
+    assert uri == "data:image/png;base64," + base64.b64encode(b"one").decode()
+    img.write_bytes(b"two!")
+    st = os.stat(img)
+    assert core._data_uri(str(img), st.st_mtime_ns, st.st_size).endswith(
+        base64.b64encode(b"two!").decode()
+    )
+
+
+def test_data_uri_falls_back_to_mimetypes_for_uncommon_suffixes(tmp_path):
+    import os
+
+    for name, mime in (("a.tiff", "image/tiff"), ("a.unknownext", "image/png")):
+        img = tmp_path / name
+        img.write_bytes(b"x")
+        st = os.stat(img)
+        uri = core._data_uri(str(img), st.st_mtime_ns, st.st_size)
+        assert uri.startswith(f"data:{mime};base64,")
@@ -24,3 +24,13 @@ def test_parse_footnote_marker_runs():
     runs = parse_inline(s)
     # Expect a run with a footnote key in the sequence
     assert any(getattr(r, "footnote_key", None) == "note1" for r in runs)
+
+
+def test_inline_to_html_plain_and_marked_up_text():
+    from easypour.render import PDFTemplate, _inline_to_html
+
+    tpl = PDFTemplate()
+    assert _inline_to_html("a < b & c\nd", tpl) == "a &lt; b &amp; c<br/>d"
+    assert _inline_to_html("x **y** `z`", tpl) == (
+        f'x <b>y</b> <font face="{tpl.mono_font}">z</font>'
+    )
@@ -26,3 +26,37 @@ def test_interactive_figure_labels():
 
     rpt.to_markdown()
     assert rpt.ref("fig:int") == "Figure 1"
+
+
+def test_nested_figures_numbered_in_block_order():
+    rpt = Report("Order")
+    sec = rpt.add_section("Top")
+    sec.add_figure("a.png", caption="a", label="fig:a")
+    sec.add_section("Child").add_figure("b.png", caption="b", label="fig:b")
+    sec.add_figure("c.png", caption="c", label="fig:c")
+    assert [rpt.ref(k) for k in ("fig:a", "fig:b", "fig:c")] == [
+        "Figure 1",
+        "Figure 2",
+        "Figure 3",
+    ]
+
+
+def test_label_index_refreshes_after_new_figures():
+    rpt = Report("Refresh")
+    sec = rpt.add_section("S")
+    sec.add_figure("a.png", caption="a", label="fig:a")
+    assert rpt.ref("fig:a") == "Figure 1"
+    sec.add_figure("b.png", caption="b", label="fig:b")
+    assert rpt.ref("fig:b") == "Figure 2"
+    rpt.meta["figure_prefix"] = "Fig."
+    assert rpt.ref("fig:a") == "Fig. 1"
+
+
+def test_label_index_refreshes_after_in_place_replacement():
+    rpt = Report("Replace")
+    sec = rpt.add_section("S")
+    sec.add_figure("a.png", caption="a", label="fig:a")
+    assert rpt.ref("fig:a") == "Figure 1"
+    sec.blocks[0] = FigureBlock(image=Image("b.png"), caption="b", label="fig:b")
+    assert rpt.ref("fig:b") == "Figure 1"
+    assert "**Figure 1:** b" in rpt.to_markdown()
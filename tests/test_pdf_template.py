@@ -25,6 +25,13 @@ def test_heading_override_applied():
     assert para.style.fontSize == 42
 
 
+def test_paragraph_styles_are_shared_for_identical_settings():
+    tpl = PDFTemplate()
+    first = _heading("One", 2, tpl, None).style
+    assert _heading("Two", 2, tpl, None).style is first
+    assert _heading("Big", 2, tpl, {"font_size": 30}).style is not first
+
+
 def test_ieee_template_defaults():
     tpl = IEEETemplate()
     assert tpl.layout == "two"
@@ -43,6 +50,22 @@ def test_single_layout_uses_base_template(tmp_path):
     assert float(getattr(frame, "_height", frame.height)) == pytest.approx(height)
 
 
+def test_frame_bounds_cached_until_geometry_changes():
+    tpl = PDFTemplate(layout="custom")
+    calls = {"count": 0}
+
+    def builder(template: PDFTemplate):
+        calls["count"] += 1
+        return template._single_frames()
+
+    tpl.register_layout("custom", builder)
+    first = tpl.frame_bounds()
+    assert tpl.frame_bounds() == first and calls["count"] == 1
+    tpl.margin_left += 36
+    assert tpl.frame_bounds()[0] == pytest.approx(first[0] - 36)
+    assert calls["count"] == 2
+
+
 def test_configure_pdf_heading_override_merges():
     rpt = Report("Colors")
     rpt.configure_pdf(heading_overrides={2: {"color": "#123456"}})
@@ -58,3 +81,66 @@ def test_page_layouts_apply_to_specific_pages(tmp_path):
     template_frames = {pt.id: len(pt.frames) for pt in doc.pageTemplates}
     assert template_frames.get("PageLayout_two") == 2
     assert template_frames.get("Main") == 1
+
+
+def test_block_flowables_dispatch_resolves_subclasses():
+    from easypour.core import Table
+    from easypour.render import _block_flowables, _NumberingState
+    from reportlab.platypus import Table as RLTable
+
+    class FancyTable(Table):
+        pass
+
+    tpl = PDFTemplate(autoscale_tables=False)
+    flows = _block_flowables(FancyTable(headers=["A"], rows=[["1"]]), tpl, _NumberingState(), {})
+    assert len(flows) == 1 and isinstance(flows[0], RLTable)
+    assert _block_flowables(object(), tpl, _NumberingState(), {}) == []
+
+    class Note:
+        def to_markdown(self):
+            return "note"
+
+    from easypour import render
+
+    assert len(_block_flowables(Note(), tpl, _NumberingState(), {})) == 1
+    assert Note in render._PDF_UNHANDLED_TYPES
+
+
+def test_repeated_short_paragraphs_share_parsed_fragments():
+    from easypour.render import _paragraph
+
+    tpl = PDFTemplate()
+    first = _paragraph("Continued *below*", tpl)
+    second = _paragraph("Continued *below*", tpl)
+    assert first is not second and first.frags is not second.frags
+    assert all(a is b for a, b in zip(first.frags, second.frags, strict=True))
+
+
+def test_nested_section_spacers_are_merged():
+    from easypour.core import Section
+    from easypour.render import _NumberingState, _render_section
+    from reportlab.platypus import Spacer
+
+    tpl = PDFTemplate()
+    outer = Section("Outer")
+    outer.add_section("Inner").add_text("body")
+    flows = _render_section(outer, tpl, _NumberingState(), {})
+    spacers = [f for f in flows if isinstance(f, Spacer)]
+    gap = tpl.base_font_size * tpl.section_spacing
+    assert not any(isinstance(a, Spacer) and isinstance(b, Spacer) for a, b in zip(flows, flows[1:], strict=False))
+    assert spacers[-1].height == pytest.approx(2 * gap)
+
+
+def test_user_spacers_are_not_merged_into_section_gaps():
+    from easypour.core import Section
+    from easypour.render import _NumberingState, _render_section
+    from reportlab.platypus import Spacer
+
+    tpl = PDFTemplate()
+    sec = Section("Spaced")
+    sec.add_vertical_space(30)
+    sec.add_pdf_flowable(lambda template: Spacer(1, 12))
+    flows = _render_section(sec, tpl, _NumberingState(), {})
+    gap = tpl.base_font_size * tpl.section_spacing
+    heights = [f.height for f in flows if isinstance(f, Spacer)]
+    assert heights == pytest.approx([gap, 30, gap, 12, gap])
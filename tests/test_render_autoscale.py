@@ -192,3 +192,67 @@ def test_image_flowable_shrinks_to_runtime_frame(monkeypatch):
     # When height budget is tiny, we still report the full height so the flowable moves to the next page.
     _, tall_h = image_flow.wrapOn(canv, 200, 40)
     assert tall_h > 40
+
+
+def test_image_dims_decode_each_file_once(monkeypatch, tmp_path):
+    opened = []
+
+    class CountingReader:
+        def __init__(self, path):
+            opened.append(path)
+
+        def getSize(self):
+            return (320, 240)
+
+    monkeypatch.setattr(render_mod, "ImageReader", CountingReader)
+    img = tmp_path / "logo.png"
+    img.write_bytes(b"not really a png")
+    assert render_mod._image_dims(str(img)) == (320, 240)
+    assert render_mod._image_dims(str(img)) == (320, 240)
+    assert opened == [str(img)]
+
+
+def test_table_base_style_is_shared_and_extra_commands_follow_it():
+    template = PDFTemplate(autoscale_tables=False)
+    _table(_sample_table(), template)
+    hits = render_mod._cached_table_style.cache_info().hits
+    extra = ("BACKGROUND", (0, 1), (-1, -1), "#ff0000")
+    flowable = _table(_sample_table(style=[extra]), template)
+    assert render_mod._cached_table_style.cache_info().hits == hits + 1
+    assert [cmd[0] for cmd in flowable._bkgrndcmds] == ["BACKGROUND", "BACKGROUND"]
+    assert flowable._bkgrndcmds[-1][1:3] == extra[1:3]
+
+
+def test_scaling_image_clamps_once_and_only_shrinks_for_narrow_columns(tmp_png):
+    img = render_mod._ScalingImage(
+        str(tmp_png), width=400, height=200, max_width=300, max_height=500
+    )
+    assert img.wrap(1000, 1000) == pytest.approx((300, 150))
+    assert img.wrap(150, 1000) == pytest.approx((150, 75))
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [(" 12 PX", 12.0), ("1.5e2px", 150.0), ("50%", 0.5), (7, 7.0), ("100", None), ("px", None)],
+)
+def test_parse_dimension_units(value, expected):
+    template = PDFTemplate()
+    result = render_mod._parse_dimension(value, template, axis="width")
+    if isinstance(value, str) and value.endswith("%"):
+        expected *= template.frame_bounds()[0]
+    assert result == (pytest.approx(expected) if expected is not None else None)
+
+
+def test_scaled_flowable_reuses_last_wrap_for_same_space():
+    calls = []
+
+    class Inner(RLTable):
+        def wrap(self, aw, ah):
+            calls.append((aw, ah))
+            return super().wrap(aw, ah)
+
+    flow = _ScaledFlowable(Inner([["a", "b"]]), 0.5)
+    first = flow.wrap(200, 300)
+    assert flow.wrap(200, 300) == first and len(calls) == 1
+    flow.wrap(100, 300)
+    assert calls[-1] == (200, 600)
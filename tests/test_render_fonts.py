@@ -23,6 +23,7 @@ def _mock_font_stack(monkeypatch, existing=None):
             self.path = path
 
     monkeypatch.setattr(render_mod, "TTFont", DummyTTFont)
+    monkeypatch.setattr(render_mod, "_REGISTERED_FONTS", {})
     monkeypatch.setattr(render_mod.pdfmetrics, "getFont", fake_get_font)
     monkeypatch.setattr(render_mod.pdfmetrics, "registerFont", fake_register)
     return registered
@@ -72,6 +73,19 @@ def test_font_name_collision_allocates_suffix(tmp_path, monkeypatch):
     assert registered[template.font].path == str(font_path)
 
 
+def test_font_file_is_registered_once_across_templates(tmp_path, monkeypatch):
+    registered = _mock_font_stack(monkeypatch)
+    font_path = _make_font_file(tmp_path, "Shared")
+    first = PDFTemplate(font=str(font_path))
+    second = PDFTemplate(font=str(font_path))
+
+    first._prepare_fonts()
+    second._prepare_fonts()
+
+    assert first.font == second.font == "Shared"
+    assert list(registered) == ["Shared"]
+
+
 def test_configure_pdf_merges_font_files(tmp_path, monkeypatch):
     registered = _mock_font_stack(monkeypatch)
     font_path = _make_font_file(tmp_path, "DocuSans")
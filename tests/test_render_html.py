@@ -11,3 +11,30 @@ def test_markdown_to_html_contains_inline_css_and_body():
     assert "<h1>Title</h1>" in html
     # basic sanity that our default CSS variables are present
     assert "--text:" in html
+
+
+def test_markdown_to_html_fragment_has_no_document_wrapper():
+    from easypour.render import markdown_to_html_fragment
+
+    frag = markdown_to_html_fragment("Some **bold** ~~old~~ text")
+    assert frag == "<p>Some <strong>bold</strong> <s>old</s> text</p>\n"
+    assert frag in markdown_to_html("Some **bold** ~~old~~ text")
+
+
+def test_markdown_to_html_reuses_render_for_unchanged_input():
+    from easypour import render
+
+    first = markdown_to_html("# Cached\n\nBody", title="T")
+    hits = render._cached_markdown_to_html.cache_info().hits
+    assert markdown_to_html("# Cached\n\nBody", title="T") is first
+    assert render._cached_markdown_to_html.cache_info().hits == hits + 1
+    assert markdown_to_html("# Cached\n\nBody", title="Other") != first
+
+
+def test_markdown_parser_is_built_once():
+    from easypour.render import _markdown_parser, markdown_to_html_fragment
+
+    markdown_to_html_fragment("one")
+    parser = _markdown_parser()
+    markdown_to_html_fragment("two")
+    assert _markdown_parser() is parser
@@ -23,6 +23,16 @@ def test_report_write_pdf_default(tmp_path, ensure_pdf_capability):
     assert len(data) > 200
 
 
+def test_report_write_pdf_to_binary_stream(ensure_pdf_capability):
+    import io
+
+    rpt = Report("Stream PDF Test")
+    rpt.add_section("Intro").add_text("Written straight into memory.")
+    buf = io.BytesIO()
+    assert rpt.write_pdf(buf) is buf
+    assert buf.getvalue()[:4] == b"%PDF"
+
+
 def test_report_write_pdf_with_template(tmp_path, ensure_pdf_capability):
     rpt = Report("Template Demo", author="EasyPour")
     rpt.add_section("Summary").add_text("Hello **world**!", "Some _italic_ text.")
@@ -168,3 +178,79 @@ def test_pdf_render_randomized(tmp_path, tmp_png, ensure_pdf_capability, report,
     data = pdf_path.read_bytes()
     assert data.startswith(b"%PDF")
     assert len(data) > 200
+
+
+def test_pdf_bytes_rerender_on_every_call(ensure_pdf_capability):
+    rpt = Report("Fresh PDF")
+    sec = rpt.add_section("Intro")
+    tbl = Table(headers=["A"], rows=[["x" * 400]])
+    sec.add_table(tbl)
+    first = rpt._pdf_bytes()
+    assert first.startswith(b"%PDF")
+    # In-place edits must show up without any cache invalidation
+    tbl.rows[0][0] = "short"
+    second = rpt._pdf_bytes()
+    assert second != first
+    # The shared scratch buffer is rewound and truncated between renders
+    assert second.startswith(b"%PDF")
+    assert second.rstrip().endswith(b"%%EOF")
+    assert second.count(b"%%EOF") == 1
+
+
+def test_streaming_template_matches_eager_layout(ensure_pdf_capability):
+    import io
+    import re
+
+    rpt = Report("Streaming")
+    for idx in range(40):
+        sec = rpt.add_section(f"Section {idx}")
+        sec.add_text("Paragraph text. " * 40)
+        sec.add_table(Table(headers=["A", "B"], rows=[[str(idx), "x"]] * 5))
+    pages = []
+    for streaming in (False, True):
+        buf = io.BytesIO()
+        rpt.write_pdf(buf, template=PDFTemplate(streaming=streaming))
+        pages.append(len(re.findall(rb"/Type /Page(?!s)", buf.getvalue())))
+    assert pages[0] > 1
+    assert pages[0] == pages[1]
+
+
+def test_dataframe_cells_are_stringified_before_layout():
+    pd = pytest.importorskip("pandas")
+    from easypour.core import DataFrameBlock
+    from easypour.render import _render_dataframe
+
+    df = pd.DataFrame({"n": [1, 2], "x": [0.5, 1.25]})
+    flow = _render_dataframe(DataFrameBlock(df), PDFTemplate(autoscale_tables=False))[0]
+    assert flow._cellvalues == [["n", "x"], ["1", "0.5"], ["2", "1.25"]]
+
+
+def test_default_footer_draws_page_number_with_precomputed_geometry():
+    from easypour.render import _default_footer, _on_page
+
+    calls = []
+
+    class RecordingCanvas:
+        def getPageNumber(self):
+            return 3
+
+        def __getattr__(self, name):
+            return lambda *args: calls.append((name, args))
+
+    template = PDFTemplate(page_size=(600, 800), margin_bottom=40, footer_fn=_default_footer)
+    _on_page(template)(RecordingCanvas(), None)
+    assert ("drawCentredString", (300.0, 20.0, "Page 3")) in calls
+    assert calls[0][0] == "saveState" and calls[-1][0] == "restoreState"
+
+
+def test_image_reader_pool_is_emptied_after_each_build(tmp_png, ensure_pdf_capability):
+    import io
+
+    from easypour.core import Image
+    from easypour.render import _pooled_image_reader
+
+    rpt = Report("Pool")
+    sec = rpt.add_section("Pics")
+    sec.blocks.extend([Image(str(tmp_png)), Image(str(tmp_png))])
+    rpt.write_pdf(io.BytesIO())
+    assert _pooled_image_reader.cache_info().currsize == 0
@@ -37,6 +37,12 @@ def test_section_codeblock_handles_backticks_inside():
     assert code in md
 
 
+def test_section_codeblock_fence_outgrows_longest_run():
+    code = "a ```` b"
+    md = Section("Long").add_codeblock(code).to_markdown()
+    assert "`````\na ```` b\n`````" in md
+
+
 def test_section_strikethrough_paragraph():
     s = Section("Strike").add_strikethrough("old text")
     md = s.to_markdown()
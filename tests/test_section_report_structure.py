@@ -1,7 +1,9 @@
 # tests/test_section_report_structure.py
 import re
 
-from easypour import Report
+import pytest
+
+from easypour import Report, Section, Table
 
 
 def test_report_markdown_front_matter_and_title(sample_report):
@@ -39,3 +41,87 @@ def test_write_markdown(tmp_path, sample_report):
     with open(path, encoding="utf-8") as f:
         content = f.read()
     assert "# Weekly Model Analysis" in content
+
+
+def test_section_markdown_reflects_in_place_edits(tmp_png):
+    rpt = Report("Edits")
+    sec = rpt.add_section("Top")
+    sub = sec.add_section("Child")
+    sub.add_text("first")
+    assert "first" in sec.to_markdown()
+
+    sub.blocks.append("direct append")
+    assert "direct append" in sec.to_markdown()
+
+    tbl = Table(headers=["A"], rows=[["old cell"]])
+    sub.add_table(tbl)
+    assert "old cell" in sec.to_markdown()
+    tbl.rows[0][0] = "new cell"
+    tbl.headers[0] = "Renamed"
+    md = sec.to_markdown()
+    assert "new cell" in md and "old cell" not in md
+    assert "| Renamed |" in md
+
+    sec.add_image_path(tmp_png, alt="dot")
+    img = sec.blocks[-1]
+    img.path = "moved.png"
+    assert "(moved.png)" in sec.to_markdown()
+
+
+def test_section_markdown_reflects_dataframe_edits():
+    pd = pytest.importorskip("pandas")
+    from easypour.core import DataFrameBlock
+
+    df = pd.DataFrame({"x": [1, 2]})
+    sec = Section("Frame", blocks=[DataFrameBlock(df)])
+    assert "1" in sec.to_markdown()
+    df.loc[0, "x"] = 41
+    assert "41" in sec.to_markdown()
+
+
+def test_walk_tracks_nested_additions():
+    rpt = Report("Walk")
+    a = rpt.add_section("A")
+    assert [s.title for s in rpt.walk()] == ["A"]
+    a.add_section("A.1")
+    b = rpt.add_section("B")
+    assert [s.title for s in rpt.walk()] == ["A", "A.1", "B"]
+    b.blocks.append(Section("B.1"))
+    assert rpt.find_section("b.1") is not None
+    assert "'B > B.1'" in repr(rpt)
+
+
+def test_walk_tracks_in_place_replacement():
+    rpt = Report("Walk")
+    a = rpt.add_section("A")
+    a.add_section("Old")
+    assert [s.title for s in rpt.walk()] == ["A", "Old"]
+    a.blocks[0] = Section("New")
+    assert [s.title for s in rpt.walk()] == ["A", "New"]
+    assert rpt.find_section("old") is None
+    rpt.sections[0] = Section("Z")
+    assert [s.title for s in rpt.walk()] == ["Z"]
+
+
+def test_find_section_follows_renames_and_prefers_first_match():
+    rpt = Report("Find")
+    first = rpt.add_section("Dup")
+    rpt.add_section("dup ")
+    assert rpt.find_section(" DUP") is first
+    first.title = "Renamed"
+    assert rpt.find_section("renamed") is first
+    assert rpt.find_section("dup") is rpt.sections[1]
+    assert rpt.find_section("missing") is None
+
+
+def test_toc_refreshes_on_rename_and_nested_additions():
+    rpt = Report("TOC")
+    a = rpt.add_section("A")
+    rpt.add_section("B")
+    assert "- [A](#a)" in rpt.to_markdown()
+    a.title = "Alpha"
+    a.anchor = None
+    a.add_section("Deep")
+    md = rpt.to_markdown()
+    assert "- [Alpha](#alpha)" in md
+    assert "  - [Deep](#deep)" in md
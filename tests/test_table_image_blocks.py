@@ -11,6 +11,14 @@ def test_table_markdown():
     assert md[3] == "| 3 | 4 |"
 
 
+def test_table_markdown_escapes_cells_in_bulk_and_fallback():
+    t = Table(headers=["A|B", "C"], rows=[["x|y", "1\n2"], []])
+    assert t.to_markdown().splitlines()[2:] == ["| x\\|y | 1<br>2 |", "|  |"]
+    # Cells holding the bulk-path sentinel characters take the per-cell path
+    odd = Table(headers=["A", "B"], rows=[["a\x00b", "c|d"]])
+    assert odd.to_markdown().splitlines()[2] == "| a\x00b | c\\|d |"
+
+
 def test_table_from_dicts():
     rows = [{"A": 1, "B": 2}, {"A": 3, "B": 4}]
     t = Table.from_dicts(rows)
@@ -39,3 +47,11 @@ def test_section_add_blocks(sample_table, tmp_png):
     assert "## Top" in md
     assert "| Metric | Value |" in md
     assert "![](" in md or "![dot](" in md
+
+
+def test_pdf_style_defaults_to_a_writable_dict():
+    for obj in (Table(headers=["A"], rows=[]), Image("x.png"), Section("S")):
+        obj.pdf_style["font"] = "Helvetica"
+        assert obj.pdf_style == {"font": "Helvetica"}
+    # Each instance owns its dict
+    assert Section("T").pdf_style == {}